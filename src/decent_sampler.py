@@ -5,17 +5,45 @@ This module provides classes to represent and generate DecentSampler (.dspreset)
 DecentSampler is a free, cross-platform sampler plugin that can load .dspreset files.
 """
 
+import sys
 from pathlib import Path
 from typing import List, Optional
 from lxml import etree
 
 
+# String forms of every MIDI value (0-127), shared by all sample elements
+_MIDI_STR = tuple(str(value) for value in range(128))
+
+# XML spellings of boolean attribute values
+_BOOL_STR = {True: "true", False: "false"}
+
+# Preset files are written through a large buffer so lxml's many small writes
+# reach the disk in few system calls
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Concrete class Path() instantiates on this platform (PosixPath/WindowsPath)
+_PATH_TYPE = type(Path())
+
+
+def _midi_str(value: int) -> str:
+    """Return str(value), using the lookup table for MIDI-range values."""
+    return _MIDI_STR[value] if 0 <= value < 128 else str(value)
+
+
+def _intern(value):
+    """Intern strings loaded from project files so repeated values share one object."""
+    return sys.intern(value) if type(value) is str else value
+
+
 class Sample:
     """
     Represents a single sample within a group in a DecentSampler preset.
     
     Attributes:
         file_path (Path): Path to the sample file
+        file_name (str): Cached file name of file_path (updated when file_path is set)
+        file_stem (str): Cached file name without extension
+        file_stem_lower (str): Cached lower-cased file_stem
         root_note (int): Root note (MIDI note number, 0-127, default: 60)
         low_note (int): Lowest note this sample responds to (0-127, default: 0)
         high_note (int): Highest note this sample responds to (0-127, default: 127)
@@ -26,6 +54,11 @@ class Sample:
         seq_position (int): Position in round robin queue (default: 1)
     """
     
+    # Presets hold thousands of samples, so skip the per-instance __dict__
+    __slots__ = ("_file_path", "file_name", "file_stem", "file_stem_lower", "_xml_path",
+                 "root_note", "low_note", "high_note", "low_velocity", "high_velocity",
+                 "seq_mode", "seq_length", "seq_position", "selected")
+    
     def __init__(self, file_path: Path, root_note: int = 60, low_note: int = 0, 
                  high_note: int = 127, low_velocity: int = 0, high_velocity: int = 127,
                  seq_mode: str = "always", seq_length: int = 0, seq_position: int = 1):
@@ -43,46 +76,83 @@ class Sample:
             seq_length: Length of round robin queue (default: 0)
             seq_position: Position in round robin queue (default: 1)
         """
-        self.file_path = Path(file_path)
+        self.file_path = file_path
         self.root_note = root_note
         self.low_note = low_note
         self.high_note = high_note
         self.low_velocity = low_velocity
         self.high_velocity = high_velocity
-        self.seq_mode = seq_mode
+        self.seq_mode = _intern(seq_mode)
         self.seq_length = seq_length
         self.seq_position = seq_position
         self.selected = False  # For checkbox selection
     
-    def to_xml_element(self, samples_path: str = "Samples") -> etree.Element:
+    @property
+    def file_path(self) -> Path:
+        """Path to the sample file."""
+        return self._file_path
+    
+    @file_path.setter
+    def file_path(self, file_path: Path):
+        """Set the sample file path and cache the name parts derived from it."""
+        # Callers usually pass Path objects already; only parse strings
+        self._file_path = file_path if type(file_path) is _PATH_TYPE else Path(file_path)
+        # UI refreshes read these on every repaint, so parse the path only once
+        self.file_name = self._file_path.name
+        self.file_stem = self._file_path.stem
+        self.file_stem_lower = self.file_stem.lower()
+        self._xml_path = None  # (samples_path, "samples_path/file_name") for xml_attributes
+    
+    def xml_attributes(self, samples_path: str = "Samples") -> dict:
         """
-        Convert this Sample to an XML element.
+        Get the attributes of this sample's XML element, in output order.
         
         Args:
             samples_path: Base path for samples (default: "Samples")
         
         Returns:
-            lxml.etree.Element representing this sample
+            Dict mapping attribute names to their string values
         """
-        sample_element = etree.Element("sample")
-        # Use samples_path + filename instead of full file path
-        file_path = samples_path + "/" + self.file_path.name
-        sample_element.set("path", file_path)
-        sample_element.set("rootNote", str(self.root_note))
-        sample_element.set("loNote", str(self.low_note))
-        sample_element.set("hiNote", str(self.high_note))
-        sample_element.set("loVel", str(self.low_velocity))
-        sample_element.set("hiVel", str(self.high_velocity))
+        # Use samples_path + filename instead of full file path. samples_path is
+        # the same for a whole preset, so the joined string is kept between calls.
+        xml_path = self._xml_path
+        if xml_path is None or xml_path[0] != samples_path:
+            xml_path = self._xml_path = (samples_path, samples_path + "/" + self.file_name)
+        
+        attributes = {
+            "path": xml_path[1],
+            "rootNote": _midi_str(self.root_note),
+            "loNote": _midi_str(self.low_note),
+            "hiNote": _midi_str(self.high_note),
+            "loVel": _midi_str(self.low_velocity),
+            "hiVel": _midi_str(self.high_velocity),
+        }
         
         # Add round robin attributes if not default values
         if self.seq_mode != "always":
-            sample_element.set("seqMode", self.seq_mode)
+            attributes["seqMode"] = self.seq_mode
         if self.seq_length > 0:
-            sample_element.set("seqLength", str(self.seq_length))
+            attributes["seqLength"] = _midi_str(self.seq_length)
         if self.seq_position != 1:
-            sample_element.set("seqPosition", str(self.seq_position))
+            attributes["seqPosition"] = _midi_str(self.seq_position)
+        
+        return attributes
+    
+    def to_xml_element(self, samples_path: str = "Samples", parent: Optional[etree._Element] = None) -> etree.Element:
+        """
+        Convert this Sample to an XML element.
+        
+        Args:
+            samples_path: Base path for samples (default: "Samples")
+            parent: Element to create the sample under (default: a standalone element)
         
-        return sample_element
+        Returns:
+            lxml.etree.Element representing this sample
+        """
+        attributes = self.xml_attributes(samples_path)
+        if parent is not None:
+            return etree.SubElement(parent, "sample", attributes)
+        return etree.Element("sample", attributes)
 
 
 class SampleGroup:
@@ -98,8 +168,19 @@ class SampleGroup:
         seq_mode (str): Round robin mode for the group (default: "always")
         seq_length (int): Length of round robin queue for the group (default: 0)
         samples (List[Sample]): List of samples in this group
+        root_note (int): Root note set from the keyboard by the mapping table (default: 60)
+        low_note (int): Low note set from the keyboard by the mapping table (default: 0)
+        high_note (int): High note set from the keyboard by the mapping table (default: 127)
     """
     
+    __slots__ = ("name", "enabled", "volume", "amp_vel_track", "group_tuning",
+                 "seq_mode", "seq_length", "samples", "selected", "_attrs_cache",
+                 "root_note", "low_note", "high_note")
+    
+    # Attributes serialized by xml_attributes; assigning any of them drops the cached dict
+    _XML_FIELDS = frozenset(("enabled", "volume", "amp_vel_track", "group_tuning",
+                             "seq_mode", "seq_length"))
+    
     def __init__(self, name: str = "", enabled: bool = True, volume: str = "1.0", 
                  amp_vel_track: float = 0.0, group_tuning: float = 0.0, 
                  seq_mode: str = "always", seq_length: int = 0, samples: List[Sample] = None):
@@ -121,10 +202,19 @@ class SampleGroup:
         self.volume = volume
         self.amp_vel_track = amp_vel_track
         self.group_tuning = group_tuning
-        self.seq_mode = seq_mode
+        self.seq_mode = _intern(seq_mode)
         self.seq_length = seq_length
         self.samples = samples or []
         self.selected = False  # For checkbox selection
+        # Set by SampleGroupModel.update_sample_group_range; not written to the XML
+        self.root_note = 60
+        self.low_note = 0
+        self.high_note = 127
+    
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name in SampleGroup._XML_FIELDS:
+            object.__setattr__(self, "_attrs_cache", None)
     
     def add_sample(self, sample: Sample) -> None:
         """
@@ -142,36 +232,82 @@ class SampleGroup:
         Args:
             sample: Sample to remove
         """
-        if sample in self.samples:
+        try:
             self.samples.remove(sample)
+        except ValueError:
+            pass
     
-    def to_xml_element(self, samples_path: str = "Samples") -> etree.Element:
+    def remove_many(self, samples: set) -> None:
         """
-        Convert this SampleGroup to an XML element.
+        Remove several samples from this group in a single pass.
         
         Args:
-            samples_path: Base path for samples (default: "Samples")
+            samples: Set of samples to remove
+        """
+        self.samples[:] = [sample for sample in self.samples if sample not in samples]
+    
+    def xml_attributes(self) -> dict:
+        """
+        Get the attributes of this group's XML element, in output order.
+        
+        The dict is cached until one of the serialized attributes is assigned,
+        so callers must not modify it.
         
         Returns:
-            lxml.etree.Element representing this sample group
+            Dict mapping attribute names to their string values
         """
-        group_element = etree.Element("group")
+        attributes = self._attrs_cache
+        if attributes is None:
+            attributes = self._attrs_cache = self.build_xml_attributes()
+        return attributes
+    
+    def build_xml_attributes(self) -> dict:
+        """
+        Build the attributes of this group's XML element from its current values.
         
+        Returns:
+            Dict mapping attribute names to their string values
+        """
         # Add group attributes
-        group_element.set("enabled", str(self.enabled).lower())
-        group_element.set("volume", self.volume)
-        group_element.set("ampVelTrack", str(self.amp_vel_track))
-        group_element.set("groupTuning", str(self.group_tuning))
+        attributes = {
+            "enabled": _BOOL_STR.get(self.enabled) or str(self.enabled).lower(),
+            "volume": self.volume,
+            # DecentSampler defaults ampVelTrack to 1, so our 0.0 must always be written
+            "ampVelTrack": str(self.amp_vel_track),
+        }
+        
+        # Tuning defaults to 0 in DecentSampler, so only write it when it differs
+        if self.group_tuning != 0.0:
+            attributes["groupTuning"] = str(self.group_tuning)
         
         # Add round robin attributes if not default values
         if self.seq_mode != "always":
-            group_element.set("seqMode", self.seq_mode)
+            attributes["seqMode"] = self.seq_mode
         if self.seq_length > 0:
-            group_element.set("seqLength", str(self.seq_length))
+            attributes["seqLength"] = str(self.seq_length)
+        
+        return attributes
+    
+    def to_xml_element(self, samples_path: str = "Samples", parent: Optional[etree._Element] = None) -> etree.Element:
+        """
+        Convert this SampleGroup to an XML element.
+        
+        Args:
+            samples_path: Base path for samples (default: "Samples")
+            parent: Element to create the group under (default: a standalone element)
+        
+        Returns:
+            lxml.etree.Element representing this sample group
+        """
+        attributes = self.xml_attributes()
+        if parent is not None:
+            group_element = etree.SubElement(parent, "group", attributes)
+        else:
+            group_element = etree.Element("group", attributes)
         
-        # Add all samples in this group
+        # Add all samples in this group, created directly inside it
         for sample in self.samples:
-            group_element.append(sample.to_xml_element(samples_path))
+            sample.to_xml_element(samples_path, group_element)
         
         return group_element
 
@@ -207,7 +343,7 @@ class DecentPreset:
         self.description = description
         self.category = category
         self.sample_groups = sample_groups or []
-        self.samples_path = samples_path
+        self.samples_path = _intern(samples_path)
     
     def add_sample_group(self, sample_group: SampleGroup) -> None:
         """
@@ -218,6 +354,81 @@ class DecentPreset:
         """
         self.sample_groups.append(sample_group)
     
+    @staticmethod
+    def root_attributes(min_version: str = "0") -> dict:
+        """
+        Get the attributes of the <DecentSampler> root element.
+        
+        Args:
+            min_version: Minimum version required (default: "0", omit if 0 or empty)
+        
+        Returns:
+            Dict mapping attribute names to their string values
+        """
+        # Add minVersion only if it's not 0 or empty
+        if min_version and min_version != "0":
+            return {"minVersion": min_version}
+        return {}
+    
+    @staticmethod
+    def header_comments(preset_name: str = "", author: str = "", category: str = "",
+                        description: str = "") -> List[str]:
+        """
+        Get the texts of the preset information comments, in output order.
+        
+        Args:
+            preset_name: Name of the preset
+            author: Author of the preset
+            category: Category of the preset
+            description: Description of the preset
+        
+        Returns:
+            List of comment texts, one for each non-empty field
+        """
+        comments = []
+        if preset_name:
+            comments.append(f" Preset Name: {preset_name} ")
+        if author:
+            comments.append(f" Author: {author} ")
+        if category:
+            comments.append(f" Category: {category} ")
+        if description:
+            comments.append(f" Description: {description} ")
+        return comments
+    
+    @staticmethod
+    def groups_attributes(global_volume: str = "1.0", global_tuning: str = "0.0",
+                          glide_time: str = "0.0", glide_mode: str = "legato",
+                          global_seq_mode: str = "always", global_seq_length: str = "0") -> dict:
+        """
+        Get the attributes of the <groups> container element, in output order.
+        
+        Args:
+            global_volume: Global volume for groups (default: "1.0")
+            global_tuning: Global tuning in semitones (default: "0.0")
+            glide_time: Glide time (default: "0.0")
+            glide_mode: Glide mode - "legato", "always", or "off" (default: "legato")
+            global_seq_mode: Global round robin mode (default: "always")
+            global_seq_length: Global round robin length (default: "0")
+        
+        Returns:
+            Dict mapping attribute names to their string values
+        """
+        attributes = {
+            "volume": global_volume,
+            "globalTuning": global_tuning,
+            "glideTime": glide_time,
+            "glideMode": glide_mode,
+        }
+        
+        # Add global round robin attributes if not default values
+        if global_seq_mode != "always":
+            attributes["seqMode"] = global_seq_mode
+        if global_seq_length != "0":
+            attributes["seqLength"] = global_seq_length
+        
+        return attributes
+    
     def to_xml(self, global_volume: str = "1.0", global_tuning: str = "0.0", 
                glide_time: str = "0.0", glide_mode: str = "legato",
                global_seq_mode: str = "always", global_seq_length: str = "0",
@@ -243,46 +454,25 @@ class DecentPreset:
             lxml.etree.ElementTree representing the complete DecentSampler preset
         """
         # Create root element
-        root = etree.Element("DecentSampler")
-        
-        # Add minVersion only if it's not 0 or empty
-        if min_version and min_version != "0":
-            root.set("minVersion", min_version)
+        root = etree.Element("DecentSampler", self.root_attributes(min_version))
         
         # Add preset information as XML comments
-        if preset_name:
-            comment = etree.Comment(f" Preset Name: {preset_name} ")
-            root.append(comment)
-        if author:
-            comment = etree.Comment(f" Author: {author} ")
-            root.append(comment)
-        if category:
-            comment = etree.Comment(f" Category: {category} ")
-            root.append(comment)
-        if description:
-            comment = etree.Comment(f" Description: {description} ")
-            root.append(comment)
+        for text in self.header_comments(preset_name, author, category, description):
+            root.append(etree.Comment(text))
         
         # Add metadata (removed - now using comments instead)
         
         # Only create groups container if there are sample groups
         if self.sample_groups:
-            # Create groups container with global attributes
-            groups = etree.SubElement(root, "groups")
-            groups.set("volume", global_volume)
-            groups.set("globalTuning", global_tuning)
-            groups.set("glideTime", glide_time)
-            groups.set("glideMode", glide_mode)
+            attributes = self.groups_attributes(global_volume, global_tuning, glide_time, glide_mode,
+                                                global_seq_mode, global_seq_length)
             
-            # Add global round robin attributes if not default values
-            if global_seq_mode != "always":
-                groups.set("seqMode", global_seq_mode)
-            if global_seq_length != "0":
-                groups.set("seqLength", global_seq_length)
+            # Create groups container with global attributes
+            groups = etree.SubElement(root, "groups", attributes)
             
             # Add each sample group as a group element
             for sample_group in self.sample_groups:
-                groups.append(sample_group.to_xml_element(self.samples_path))
+                sample_group.to_xml_element(self.samples_path, groups)
         else:
             # If no sample groups, add a comment indicating empty preset
             comment = etree.Comment(" No sample groups defined ")
@@ -298,8 +488,45 @@ class DecentPreset:
         Args:
             file_path: Path where to save the preset file
         """
-        tree = self.to_xml()
-        tree.write(str(file_path), encoding='utf-8', xml_declaration=True, pretty_print=True)
+        # The stream writer indents as it goes, so no tree is built and no
+        # separate pretty-printing pass is needed
+        self.save_to_file_stream(file_path)
+    
+    def save_to_file_stream(self, file_path: Path) -> None:
+        """
+        Save this preset to a .dspreset file, writing it incrementally.
+        
+        Produces the same indented file that pretty-printing to_xml() would, but
+        streams each element to disk as it is generated instead of building the
+        whole tree in memory first.
+        
+        Args:
+            file_path: Path where to save the preset file
+        """
+        samples_path = self.samples_path
+        with open(file_path, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+            with etree.xmlfile(f, encoding='UTF-8') as xf:
+                xf.write_declaration()
+                with xf.element("DecentSampler"):
+                    # Indentation is written by hand to match pretty_print output
+                    xf.write("\n  ")
+                    if not self.sample_groups:
+                        xf.write(etree.Comment(" No sample groups defined "))
+                    else:
+                        with xf.element("groups", self.groups_attributes()):
+                            for sample_group in self.sample_groups:
+                                xf.write("\n    ")
+                                if not sample_group.samples:
+                                    xf.write(etree.Element("group", sample_group.xml_attributes()))
+                                    continue
+                                with xf.element("group", sample_group.xml_attributes()):
+                                    for sample in sample_group.samples:
+                                        xf.write("\n      ")
+                                        xf.write(etree.Element("sample", sample.xml_attributes(samples_path)))
+                                    xf.write("\n    ")
+                            xf.write("\n  ")
+                    xf.write("\n")
+            f.write(b"\n")
     
     def to_string(self, preset_name: str = "", author: str = "", category: str = "", description: str = "", min_version: str = "0") -> str:
         """
@@ -316,27 +543,24 @@ class DecentPreset:
             Formatted XML string representation
         """
         tree = self.to_xml(preset_name=preset_name, author=author, category=category, description=description, min_version=min_version)
-        # Use custom formatting for better readability
-        xml_string = etree.tostring(tree, encoding='unicode', pretty_print=True)
-        
-        # Add XML declaration header
-        xml_declaration = '<?xml version="1.0" encoding="UTF-8"?>\n'
-        
-        # Additional formatting improvements
-        lines = xml_string.split('\n')
-        formatted_lines = [xml_declaration]  # Start with XML declaration
-        
-        for line in lines:
-            # Add extra spacing around sample elements
-            if '<sample' in line:
-                formatted_lines.append('')  # Empty line before sample
-                formatted_lines.append(line)
-                formatted_lines.append('')  # Empty line after sample
+        root = tree.getroot()
+        etree.indent(root, space="  ")
+        
+        # Add extra spacing around sample elements by widening the whitespace
+        # on either side of them, so the tree is serialized once and not rescanned
+        for sample_element in root.iter("sample"):
+            previous = sample_element.getprevious()
+            if previous is not None:
+                previous.tail = "\n" + previous.tail
             else:
-                formatted_lines.append(line)
+                parent = sample_element.getparent()
+                parent.text = "\n" + parent.text
+            sample_element.tail = "\n" + sample_element.tail
         
-        return '\n'.join(formatted_lines)
-
+        # XML declaration header, followed by an empty line. lxml serializes to
+        # UTF-8 bytes natively, so decoding once beats its unicode output path.
+        xml_text = etree.tostring(root, encoding="UTF-8").decode("utf-8")
+        return '<?xml version="1.0" encoding="UTF-8"?>\n\n' + xml_text + "\n"
 
 if __name__ == "__main__":
     # Example usage
@@ -6,23 +6,74 @@ A PySide6-based GUI for creating DecentSampler (.dspreset) files.
 
 import sys
 import os
+import re
 from pathlib import Path
+from functools import lru_cache, partial
 from typing import List, Optional
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-    QGridLayout, QLabel, QLineEdit, QTextEdit, QListWidget, QPushButton,
+    QGridLayout, QLabel, QLineEdit, QTextEdit, QPlainTextEdit, QListWidget, QPushButton,
     QFileDialog, QMessageBox, QGroupBox, QSpinBox, QSplitter,
     QListWidgetItem, QFrame, QCheckBox, QTabWidget, QComboBox,
-    QMenuBar, QMenu, QDialog, QDialogButtonBox, QSlider
+    QMenuBar, QMenu, QDialog, QDialogButtonBox, QSlider, QFormLayout,
+    QPlainTextDocumentLayout
 )
-from PySide6.QtCore import Qt, Signal, QTimer
-from PySide6.QtGui import QFont, QIcon, QTextCharFormat, QColor, QSyntaxHighlighter, QKeySequence, QAction, QPixmap
+from PySide6.QtCore import Qt, Signal, QObject, QTimer, QRunnable, QThreadPool, QSignalBlocker
+from PySide6.QtGui import QFont, QIcon, QTextCharFormat, QColor, QSyntaxHighlighter, QKeySequence, QAction, QPixmap, QPixmapCache, QTextCursor, QTextDocument
 
 from decent_sampler import DecentPreset, SampleGroup
 from sample_mapping import SampleMappingWidget, RoundRobinManager
 from project_manager import Project, ProjectSettings
 
 
+# Status label colors, picked by each label's "status" dynamic property. Changing
+# the property only re-polishes the label instead of parsing a new stylesheet.
+STATUS_COLOR_STYLESHEET = """
+    QLabel[status="neutral"] { color: #666; }
+    QLabel[status="warning"] { color: #ff6b6b; }
+    QLabel[status="ok"] { color: #51cf66; }
+"""
+
+@lru_cache(maxsize=8)
+def get_font(point_size: int, bold: bool = False, family: Optional[str] = None,
+             fixed_pitch: bool = False) -> QFont:
+    """
+    Get a shared QFont for the given style.
+    
+    Fonts are built on first use rather than at import, because QFont needs a
+    QApplication. Callers must not modify the returned font.
+    """
+    font = QFont(family) if family else QFont()
+    font.setPointSize(point_size)
+    if bold:
+        font.setBold(True)
+    if fixed_pitch:
+        font.setFixedPitch(True)
+    return font
+
+
+# PyInstaller creates a temp folder and stores path in _MEIPASS
+_RESOURCE_BASE = getattr(sys, "_MEIPASS", None)
+
+
+@lru_cache(maxsize=32)
+def get_resource_path(relative_path: str) -> Optional[Path]:
+    """
+    Get absolute path to resource, works for dev and for PyInstaller.
+    
+    Looks in the PyInstaller bundle (or the working directory when running from
+    source) first, then next to the source tree. Returns None if the resource
+    is in neither place.
+    """
+    resource_path = Path(_RESOURCE_BASE or os.path.abspath(".")) / relative_path
+    
+    # Fallback to development path if PyInstaller path doesn't work
+    if not resource_path.exists():
+        resource_path = Path(__file__).parent.parent / relative_path
+    
+    return resource_path if resource_path.exists() else None
+
+
 class PreferencesDialog(QDialog):
     """Dialog for configuring application preferences."""
     
@@ -42,29 +93,26 @@ class PreferencesDialog(QDialog):
         
         # Autosave group
         autosave_group = QGroupBox("Autosave Settings")
-        autosave_layout = QVBoxLayout()
+        autosave_layout = QFormLayout()
+        # Only expanding fields (the location edit) widen; spin boxes keep their size
+        autosave_layout.setFieldGrowthPolicy(QFormLayout.ExpandingFieldsGrow)
         autosave_group.setLayout(autosave_layout)
         
         # Enable autosave checkbox
         self.autosave_enabled_checkbox = QCheckBox("Enable autosave")
         self.autosave_enabled_checkbox.setChecked(True)
         self.autosave_enabled_checkbox.toggled.connect(self.toggle_autosave_settings)
-        autosave_layout.addWidget(self.autosave_enabled_checkbox)
+        autosave_layout.addRow(self.autosave_enabled_checkbox)
         
         # Autosave interval
-        interval_layout = QHBoxLayout()
-        interval_layout.addWidget(QLabel("Autosave interval:"))
         self.autosave_interval_spinbox = QSpinBox()
         self.autosave_interval_spinbox.setRange(1, 60)
         self.autosave_interval_spinbox.setSuffix(" minutes")
         self.autosave_interval_spinbox.setValue(5)
-        interval_layout.addWidget(self.autosave_interval_spinbox)
-        interval_layout.addStretch()
-        autosave_layout.addLayout(interval_layout)
+        autosave_layout.addRow("Autosave interval:", self.autosave_interval_spinbox)
         
         # Autosave location
         location_layout = QHBoxLayout()
-        location_layout.addWidget(QLabel("Autosave location:"))
         self.autosave_location_edit = QLineEdit()
         self.autosave_location_edit.setReadOnly(True)
         location_layout.addWidget(self.autosave_location_edit)
@@ -72,30 +120,27 @@ class PreferencesDialog(QDialog):
         browse_btn = QPushButton("Browse...")
         browse_btn.clicked.connect(self.browse_autosave_location)
         location_layout.addWidget(browse_btn)
-        autosave_layout.addLayout(location_layout)
+        autosave_layout.addRow("Autosave location:", location_layout)
         
         # Info label
         info_label = QLabel("Autosave files are automatically cleaned up. Only the 5 most recent autosaves are kept.")
         info_label.setWordWrap(True)
         info_label.setStyleSheet("color: #666; font-size: 11px;")
-        autosave_layout.addWidget(info_label)
+        autosave_layout.addRow(info_label)
         
         layout.addWidget(autosave_group)
         
         # Recent projects group
         recent_group = QGroupBox("Recent Projects")
-        recent_layout = QVBoxLayout()
+        recent_layout = QFormLayout()
+        recent_layout.setFieldGrowthPolicy(QFormLayout.ExpandingFieldsGrow)
         recent_group.setLayout(recent_layout)
         
         # Max recent projects
-        max_recent_layout = QHBoxLayout()
-        max_recent_layout.addWidget(QLabel("Maximum recent projects:"))
         self.max_recent_spinbox = QSpinBox()
         self.max_recent_spinbox.setRange(1, 20)
         self.max_recent_spinbox.setValue(10)
-        max_recent_layout.addWidget(self.max_recent_spinbox)
-        max_recent_layout.addStretch()
-        recent_layout.addLayout(max_recent_layout)
+        recent_layout.addRow("Maximum recent projects:", self.max_recent_spinbox)
         
         layout.addWidget(recent_group)
         
@@ -114,6 +159,8 @@ class PreferencesDialog(QDialog):
         self.autosave_interval_spinbox.setValue(self.settings.autosave_interval)
         self.autosave_location_edit.setText(str(self.settings.temp_directory))
         self.max_recent_spinbox.setValue(self.settings.max_recent_projects)
+        # Only committed to the settings through get_settings when the dialog is accepted
+        self.browse_directory = self.settings.last_autosave_browse_directory
         
         self.toggle_autosave_settings()
     
@@ -125,15 +172,20 @@ class PreferencesDialog(QDialog):
     
     def browse_autosave_location(self):
         """Browse for autosave location."""
-        current_path = self.autosave_location_edit.text()
+        # Start where the user last browsed to, else from the current location,
+        # rather than letting an empty path drop the dialog at the filesystem root
+        current_path = (self.browse_directory
+                        or self.autosave_location_edit.text()
+                        or str(Path.home()))
         directory = QFileDialog.getExistingDirectory(
             self,
             "Select Autosave Directory",
-            current_path if current_path else ""
+            current_path
         )
         
         if directory:
             self.autosave_location_edit.setText(directory)
+            self.browse_directory = directory
     
     def get_settings(self) -> ProjectSettings:
         """Get the updated settings from the dialog."""
@@ -148,6 +200,7 @@ class PreferencesDialog(QDialog):
         new_settings.window_geometry = self.settings.window_geometry
         new_settings.last_samples_directory = self.settings.last_samples_directory
         new_settings.last_export_directory = self.settings.last_export_directory
+        new_settings.last_autosave_browse_directory = self.browse_directory
         
         return new_settings
 
@@ -172,10 +225,7 @@ class MigrationDialog(QDialog):
         
         # Header
         header_label = QLabel("Project Migration Required")
-        header_font = QFont()
-        header_font.setPointSize(14)
-        header_font.setBold(True)
-        header_label.setFont(header_font)
+        header_label.setFont(get_font(14, bold=True))
         header_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(header_label)
         
@@ -197,9 +247,10 @@ class MigrationDialog(QDialog):
         changes_text.setMaximumHeight(200)
         
         changes_content = "The following changes have been applied to make your project compatible:\n\n"
-        for change in self.changes:
-            changes_content += f"• {change}\n"
+        changes_content += "".join([f"• {change}\n" for change in self.changes])
         
+        # Read-only text never needs an undo stack
+        changes_text.setUndoRedoEnabled(False)
         changes_text.setPlainText(changes_content)
         changes_layout.addWidget(changes_text)
         
@@ -217,73 +268,119 @@ class MigrationDialog(QDialog):
         layout.addWidget(buttons)
 
 
+# Declarations, comments and tags, tried in that order at each position
+_XML_TOKEN_PATTERN = re.compile(r'(?P<decl><\?xml[^>]*\?>)|(?P<comment><!--.*-->)|(?P<tag><[^>]+>)')
+
+# Attributes inside a tag: the name and the ="value" part are colored separately
+_XML_ATTRIBUTE_PATTERN = re.compile(r'(\b\w+)?(="[^"]*")')
+
+
 class XMLSyntaxHighlighter(QSyntaxHighlighter):
     """Syntax highlighter for XML content with improved dark mode colors."""
     
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.highlighting_rules = []
         
         # XML tags - bright cyan for better visibility
-        tag_format = QTextCharFormat()
-        tag_format.setForeground(QColor(86, 156, 214))  # Bright cyan
-        tag_format.setFontWeight(QFont.Bold)
-        self.highlighting_rules.append((r'<[^>]+>', tag_format))
+        self.tag_format = QTextCharFormat()
+        self.tag_format.setForeground(QColor(86, 156, 214))  # Bright cyan
+        self.tag_format.setFontWeight(QFont.Bold)
         
         # XML attributes - bright yellow
-        attr_format = QTextCharFormat()
-        attr_format.setForeground(QColor(220, 220, 170))  # Light yellow
-        self.highlighting_rules.append((r'\b\w+="[^"]*"', attr_format))
+        self.attr_format = QTextCharFormat()
+        self.attr_format.setForeground(QColor(220, 220, 170))  # Light yellow
         
         # XML attribute values - bright green
-        attr_value_format = QTextCharFormat()
-        attr_value_format.setForeground(QColor(206, 145, 120))  # Light orange
-        self.highlighting_rules.append((r'="[^"]*"', attr_value_format))
+        self.attr_value_format = QTextCharFormat()
+        self.attr_value_format.setForeground(QColor(206, 145, 120))  # Light orange
         
         # XML comments - muted green
         comment_format = QTextCharFormat()
         comment_format.setForeground(QColor(106, 153, 85))  # Muted green
         comment_format.setFontItalic(True)
-        self.highlighting_rules.append((r'<!--.*-->', comment_format))
         
         # XML declaration - bright purple
         decl_format = QTextCharFormat()
         decl_format.setForeground(QColor(197, 134, 192))  # Light purple
         decl_format.setFontWeight(QFont.Bold)
-        self.highlighting_rules.append((r'<\?xml[^>]*\?>', decl_format))
+        
+        # Formats for the whole-token groups of _XML_TOKEN_PATTERN
+        self.token_formats = {"decl": decl_format, "comment": comment_format}
     
     def highlightBlock(self, text):
-        """Apply syntax highlighting to a block of text."""
-        import re
-        for pattern, format in self.highlighting_rules:
-            for match in re.finditer(pattern, text):
-                start, end = match.span()
-                self.setFormat(start, end - start, format)
+        """Apply syntax highlighting to a block of text in a single scan."""
+        for match in _XML_TOKEN_PATTERN.finditer(text):
+            start, end = match.span()
+            kind = match.lastgroup
+            if kind != "tag":
+                self.setFormat(start, end - start, self.token_formats[kind])
+                continue
+            
+            self.setFormat(start, end - start, self.tag_format)
+            for attribute in _XML_ATTRIBUTE_PATTERN.finditer(text, start, end):
+                name_start, value_start = attribute.start(1), attribute.start(2)
+                if name_start >= 0:
+                    self.setFormat(name_start, value_start - name_start, self.attr_format)
+                self.setFormat(value_start, attribute.end(2) - value_start, self.attr_value_format)
 
 
-class XMLEditor(QTextEdit):
+def _common_prefix_length(a: str, b: str) -> int:
+    """Length of the common prefix of two strings, found by bisecting slice compares."""
+    low, high = 0, min(len(a), len(b))
+    while low < high:
+        middle = (low + high + 1) // 2
+        if a[low:middle] == b[low:middle]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+def _common_suffix_length(a: str, b: str, limit: int) -> int:
+    """Length of the common suffix of two strings, at most limit characters."""
+    len_a, len_b = len(a), len(b)
+    low, high = 0, limit
+    while low < high:
+        middle = (low + high + 1) // 2
+        if a[len_a - middle:len_a - low] == b[len_b - middle:len_b - low]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+def _utf16_length(text: str) -> int:
+    """Length of text in UTF-16 code units, the unit QTextCursor positions use."""
+    if text.isascii():
+        return len(text)
+    return len(text.encode("utf-16-le")) // 2
+
+
+class XMLEditor(QPlainTextEdit):
     """XML editor widget with syntax highlighting and live updates."""
     
+    shown = Signal()  # Emitted whenever the editor becomes visible
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setup_editor()
         self.highlighter = XMLSyntaxHighlighter(self.document())
         self.wrap_enabled = True  # Default to wrap enabled
+        self._last_xml = None  # Text last shown by update_xml
     
     def setup_editor(self):
         """Setup the editor appearance and behavior."""
         # Set monospace font
-        font = QFont("Consolas", 11)
-        font.setFixedPitch(True)
-        self.setFont(font)
+        self.setFont(get_font(11, family="Consolas", fixed_pitch=True))
         
         # Set editor properties
         self.setReadOnly(True)
-        self.setLineWrapMode(QTextEdit.WidgetWidth)  # Default to wrap enabled
+        self.setUndoRedoEnabled(False)  # Previews are replaced, never undone
+        self.setLineWrapMode(QPlainTextEdit.WidgetWidth)  # Default to wrap enabled
         
         # Set improved dark mode styling
         self.setStyleSheet("""
-            QTextEdit {
+            QPlainTextEdit {
                 background-color: #2d2d30;
                 color: #d4d4d4;
                 border: 2px solid #3e3e42;
@@ -292,44 +389,129 @@ class XMLEditor(QTextEdit):
                 selection-background-color: #264f78;
                 selection-color: #ffffff;
             }
-            QTextEdit:focus {
+            QPlainTextEdit:focus {
                 border-color: #0078d4;
             }
         """)
     
+    def showEvent(self, event):
+        """Let the owner refresh content that was skipped while hidden."""
+        super().showEvent(event)
+        self.shown.emit()
+    
     def set_wrap_mode(self, enabled: bool):
         """Enable or disable text wrapping."""
         self.wrap_enabled = enabled
         if enabled:
-            self.setLineWrapMode(QTextEdit.WidgetWidth)
+            self.setLineWrapMode(QPlainTextEdit.WidgetWidth)
         else:
-            self.setLineWrapMode(QTextEdit.NoWrap)
+            self.setLineWrapMode(QPlainTextEdit.NoWrap)
+    
+    def invalidate(self):
+        """Forget the last shown XML so the next update_xml reloads the whole document."""
+        self._last_xml = None
     
     def update_xml(self, xml_string: str):
         """Update the XML content with improved formatting."""
-        # Store current scroll position and wrap mode
-        scrollbar = self.verticalScrollBar()
-        scroll_position = scrollbar.value()
-        current_wrap_mode = self.lineWrapMode()
-        
-        # Update content
-        self.setPlainText(xml_string)
+        old_xml = self._last_xml
+        if xml_string == old_xml:
+            return
+        self._last_xml = xml_string
         
-        # Restore wrap mode (in case it was reset)
-        self.setLineWrapMode(current_wrap_mode)
+        # Hold repaints until the document is in its final state, then paint once
+        self.setUpdatesEnabled(False)
+        try:
+            if old_xml is None or not self.replace_changed_text(old_xml, xml_string):
+                # Update content (QPlainTextEdit keeps its wrap mode across documents)
+                self.replace_document(xml_string)
+                
+                # Move cursor to top
+                cursor = self.textCursor()
+                cursor.movePosition(cursor.MoveOperation.Start)
+                self.setTextCursor(cursor)
+        finally:
+            self.setUpdatesEnabled(True)
+            self.viewport().update()
+    
+    def replace_document(self, xml_string: str):
+        """
+        Show xml_string in a freshly built document instead of refilling the current one.
+        
+        The text is laid out before the document is attached, and the highlighter
+        then colors it in one pass, instead of reacting block by block while the
+        live document is cleared and refilled. A previously swapped-in document is
+        freed together with its highlighter once the new one is attached.
+        """
+        document = QTextDocument(self)
+        document.setDocumentLayout(QPlainTextDocumentLayout(document))
+        document.setUndoRedoEnabled(False)
+        document.setDefaultFont(self.font())
+        document.setPlainText(xml_string)
+        
+        # setDocument only frees the editor's built-in document, not ones we created
+        old_document = self.document() if self.document().parent() is self else None
+        self.highlighter = XMLSyntaxHighlighter(document)
+        self.setDocument(document)
+        if old_document is not None:
+            old_document.deleteLater()
+    
+    def replace_changed_text(self, old_xml: str, new_xml: str) -> bool:
+        """
+        Replace only the region that differs between the shown and the new XML.
+        
+        Editing the middle of the document keeps its layout and highlighting
+        for the unchanged blocks, and the view keeps its scroll position.
+        Returns False when most of the text changed and a full reload is cheaper.
+        """
+        prefix_length = _common_prefix_length(old_xml, new_xml)
+        suffix_length = _common_suffix_length(
+            old_xml, new_xml, min(len(old_xml), len(new_xml)) - prefix_length)
+        if (prefix_length + suffix_length) * 2 < len(new_xml):
+            return False
         
-        # Move cursor to top
-        cursor = self.textCursor()
-        cursor.movePosition(cursor.MoveOperation.Start)
-        self.setTextCursor(cursor)
+        start = _utf16_length(old_xml[:prefix_length])
+        end = start + _utf16_length(old_xml[prefix_length:len(old_xml) - suffix_length])
         
-        # Restore scroll position if it was at the top
-        if scroll_position == 0:
-            scrollbar.setValue(0)
+        cursor = QTextCursor(self.document())
+        cursor.beginEditBlock()
+        cursor.setPosition(start)
+        cursor.setPosition(end, QTextCursor.KeepAnchor)
+        cursor.insertText(new_xml[prefix_length:len(new_xml) - suffix_length])
+        cursor.endEditBlock()
+        return True
+
+
+
+
 
 
+class AutosaveSignals(QObject):
+    """Signals of an AutosaveWorker, delivered on the GUI thread."""
+    
+    finished = Signal(bool)  # Emitted with whether the autosave file was written
 
 
+class AutosaveWorker(QRunnable):
+    """Writes a serialized autosave and prunes old autosaves off the GUI thread."""
+    
+    def __init__(self, project: Project, autosave_path: Path, autosave_text: str):
+        super().__init__()
+        self.project = project
+        self.autosave_path = autosave_path
+        self.autosave_text = autosave_text
+        # Created here so it lives on the GUI thread
+        self.signals = AutosaveSignals()
+    
+    def run(self):
+        """Write the autosave file, then remove the oldest autosaves."""
+        try:
+            Project.write_autosave_file(self.autosave_path, self.autosave_text)
+        except Exception as e:
+            print(f"Error creating autosave: {e}")
+            self.signals.finished.emit(False)
+            return
+        self.signals.finished.emit(True)
+        self.project.cleanup_autosaves()
 
 
 class DecentSamplerMainWindow(QMainWindow):
@@ -338,15 +520,39 @@ class DecentSamplerMainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         self.xml_editor = None
+        self._xml_dirty = False  # Set when an XML update was skipped while the preview was hidden
+        self._xml_cache_key = None  # Inputs of the XML currently shown in the preview
+        self._xml_body = None  # Preview text after the header, reused by header-only updates
         self.update_timer = QTimer()
         self.update_timer.setSingleShot(True)
+        self.update_timer.setInterval(300)  # Trailing debounce for live XML updates
         self.update_timer.timeout.connect(self.update_xml_live)
         
+        # Caps title/status refreshes while typing in an already modified project to 2Hz
+        self.title_update_timer = QTimer()
+        self.title_update_timer.setSingleShot(True)
+        self.title_update_timer.setInterval(500)
+        self.title_update_timer.timeout.connect(self.update_window_title)
+        
+        # Sample model changes arrive one signal per row during bulk edits;
+        # this zero-delay timer turns each burst into a single schedule_xml_update
+        self.model_change_timer = QTimer()
+        self.model_change_timer.setSingleShot(True)
+        self.model_change_timer.setInterval(0)
+        self.model_change_timer.timeout.connect(self.schedule_xml_update)
+        
         # Project management
         self.current_project: Optional[Project] = None
         self.settings_file = Path.home() / ".decent_converter" / "settings.json"
         self.settings_file.parent.mkdir(parents=True, exist_ok=True)
         self.app_settings = ProjectSettings.load_from_file(self.settings_file)
+        self._settings_dirty = False
+        self.preferences_dialog = None  # Created on first use by show_preferences
+        self._recent_menu_projects = None  # Paths the recent projects menu was last built from
+        self._recent_project_names = {}  # Display name for each recent project path
+        self.settings_save_timer = QTimer()
+        self.settings_save_timer.setSingleShot(True)
+        self.settings_save_timer.timeout.connect(self.flush_settings)
         self.autosave_timer = QTimer()
         self.autosave_timer.timeout.connect(self.autosave_project)
         
@@ -355,6 +561,43 @@ class DecentSamplerMainWindow(QMainWindow):
         self.setup_autosave()
         self.check_for_recovery_files()
     
+    def load_logo_pixmap(self, logo_path) -> QPixmap:
+        """
+        Load the logo scaled to the title bar height.
+        
+        The scaled image is cached under ~/.decent_converter/cache, keyed by the
+        source file's mtime and size, so warm starts skip the full-size PNG decode
+        and the smooth rescale. Within a run it is shared through QPixmapCache.
+        """
+        stat = os.stat(logo_path)
+        cache_key = f"logo_{stat.st_mtime:.0f}_{stat.st_size}_80"
+        pixmap = QPixmapCache.find(cache_key)
+        if pixmap is not None:
+            return pixmap
+        
+        cache_dir = self.settings_file.parent / "cache"
+        cache_path = cache_dir / f"{cache_key}.png"
+        
+        if cache_path.exists():
+            pixmap = QPixmap(str(cache_path))
+            if not pixmap.isNull():
+                QPixmapCache.insert(cache_key, pixmap)
+                return pixmap
+        
+        pixmap = QPixmap(str(logo_path))
+        if pixmap.isNull():
+            return pixmap
+        
+        # Scale the logo to appropriate size (max height 80px for better visibility)
+        scaled_pixmap = pixmap.scaledToHeight(80, Qt.SmoothTransformation)
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            scaled_pixmap.save(str(cache_path), "PNG")
+        except OSError as e:
+            print(f"Error caching logo: {e}")
+        QPixmapCache.insert(cache_key, scaled_pixmap)
+        return scaled_pixmap
+    
     def init_ui(self):
         """Initialize the user interface."""
         self.setWindowTitle("DecentSampler Library Creator")
@@ -378,28 +621,12 @@ class DecentSamplerMainWindow(QMainWindow):
         logo_label = QLabel()
         
         # Get the correct path for the logo based on whether we're running from source or executable
-        def get_resource_path(relative_path):
-            """Get absolute path to resource, works for dev and for PyInstaller"""
-            try:
-                # PyInstaller creates a temp folder and stores path in _MEIPASS
-                base_path = sys._MEIPASS
-            except Exception:
-                # Running from source
-                base_path = os.path.abspath(".")
-            return os.path.join(base_path, relative_path)
-        
         logo_path = get_resource_path("assets/DSLC Logo.png")
         
-        # Fallback to development path if PyInstaller path doesn't work
-        if not os.path.exists(logo_path):
-            logo_path = Path(__file__).parent.parent / "assets" / "DSLC Logo.png"
-        
-        if os.path.exists(logo_path):
+        if logo_path is not None:
             try:
-                pixmap = QPixmap(str(logo_path))
-                if not pixmap.isNull():
-                    # Scale the logo to appropriate size (max height 80px for better visibility)
-                    scaled_pixmap = pixmap.scaledToHeight(80, Qt.SmoothTransformation)
+                scaled_pixmap = self.load_logo_pixmap(logo_path)
+                if not scaled_pixmap.isNull():
                     logo_label.setPixmap(scaled_pixmap)
                     logo_label.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
                     # Ensure the label has enough space
@@ -412,15 +639,14 @@ class DecentSamplerMainWindow(QMainWindow):
         else:
             # Fallback to text if logo not found
             logo_label.setText("DecentSampler Library Creator")
-            title_font = QFont()
-            title_font.setPointSize(16)
-            title_font.setBold(True)
-            logo_label.setFont(title_font)
+            logo_label.setFont(get_font(16, bold=True))
         title_layout.addWidget(logo_label)
         
         # Project status indicator
         self.project_status_indicator = QLabel("●")
-        self.project_status_indicator.setStyleSheet("color: #666; font-size: 20px; font-weight: bold;")
+        self.project_status_indicator.setProperty("status", "neutral")
+        self.project_status_indicator.setStyleSheet(
+            STATUS_COLOR_STYLESHEET + "QLabel { font-size: 20px; font-weight: bold; }")
         self.project_status_indicator.setToolTip("Project Status")
         title_layout.addWidget(self.project_status_indicator)
         
@@ -545,18 +771,27 @@ class DecentSamplerMainWindow(QMainWindow):
     
     def update_recent_projects_menu(self):
         """Update the recent projects submenu."""
+        recent_projects = tuple(self.app_settings.recent_projects)
+        if recent_projects == self._recent_menu_projects:
+            return  # The menu already lists exactly these projects
+        self._recent_menu_projects = recent_projects
+        
         self.recent_menu.clear()
         
-        if not self.app_settings.recent_projects:
+        if not recent_projects:
             no_recent_action = QAction("No recent projects", self)
             no_recent_action.setEnabled(False)
             self.recent_menu.addAction(no_recent_action)
             return
         
-        for project_path in self.app_settings.recent_projects:
-            action = QAction(Path(project_path).name, self)
+        names = self._recent_project_names
+        for project_path in recent_projects:
+            name = names.get(project_path)
+            if name is None:
+                name = names[project_path] = Path(project_path).name
+            action = QAction(name, self)
             action.setStatusTip(f"Open {project_path}")
-            action.triggered.connect(lambda checked, path=project_path: self.open_project_file(Path(path)))
+            action.triggered.connect(partial(self.open_project_file, Path(project_path)))
             self.recent_menu.addAction(action)
         
         self.recent_menu.addSeparator()
@@ -568,7 +803,8 @@ class DecentSamplerMainWindow(QMainWindow):
         """Create permanent status bar widgets."""
         # Project status label
         self.project_status_label = QLabel("No Project")
-        self.project_status_label.setStyleSheet("color: #666; font-weight: bold;")
+        self.project_status_label.setProperty("status", "neutral")
+        self.project_status_label.setStyleSheet(STATUS_COLOR_STYLESHEET + "QLabel { font-weight: bold; }")
         self.statusBar().addPermanentWidget(self.project_status_label)
         
         # Sample count label
@@ -578,7 +814,8 @@ class DecentSamplerMainWindow(QMainWindow):
         
         # Autosave status label
         self.autosave_status_label = QLabel("")
-        self.autosave_status_label.setStyleSheet("color: #666; font-size: 11px;")
+        self.autosave_status_label.setProperty("status", "neutral")
+        self.autosave_status_label.setStyleSheet(STATUS_COLOR_STYLESHEET + "QLabel { font-size: 11px; }")
         self.statusBar().addPermanentWidget(self.autosave_status_label)
         
         # Update initial status
@@ -590,24 +827,24 @@ class DecentSamplerMainWindow(QMainWindow):
         if self.current_project:
             if self.current_project.is_modified:
                 self.project_status_label.setText("Modified")
-                self.project_status_label.setStyleSheet("color: #ff6b6b; font-weight: bold;")
+                self.set_label_status(self.project_status_label, "warning")
                 # Update visual indicator
                 self.project_status_indicator.setText("●")
-                self.project_status_indicator.setStyleSheet("color: #ff6b6b; font-size: 20px; font-weight: bold;")
+                self.set_label_status(self.project_status_indicator, "warning")
                 self.project_status_indicator.setToolTip("Project has unsaved changes")
             else:
                 self.project_status_label.setText("Saved")
-                self.project_status_label.setStyleSheet("color: #51cf66; font-weight: bold;")
+                self.set_label_status(self.project_status_label, "ok")
                 # Update visual indicator
                 self.project_status_indicator.setText("●")
-                self.project_status_indicator.setStyleSheet("color: #51cf66; font-size: 20px; font-weight: bold;")
+                self.set_label_status(self.project_status_indicator, "ok")
                 self.project_status_indicator.setToolTip("Project is saved")
         else:
             self.project_status_label.setText("No Project")
-            self.project_status_label.setStyleSheet("color: #666; font-weight: bold;")
+            self.set_label_status(self.project_status_label, "neutral")
             # Update visual indicator
             self.project_status_indicator.setText("●")
-            self.project_status_indicator.setStyleSheet("color: #666; font-size: 20px; font-weight: bold;")
+            self.set_label_status(self.project_status_indicator, "neutral")
             self.project_status_indicator.setToolTip("No project loaded")
         
         # Update sample count
@@ -621,23 +858,51 @@ class DecentSamplerMainWindow(QMainWindow):
         if self.app_settings.autosave_enabled:
             if self.current_project and self.current_project.is_modified:
                 self.autosave_status_label.setText("Autosave: Active")
-                self.autosave_status_label.setStyleSheet("color: #51cf66; font-size: 11px;")
+                self.set_label_status(self.autosave_status_label, "ok")
             else:
                 self.autosave_status_label.setText("Autosave: Ready")
-                self.autosave_status_label.setStyleSheet("color: #666; font-size: 11px;")
+                self.set_label_status(self.autosave_status_label, "neutral")
         else:
             self.autosave_status_label.setText("Autosave: Disabled")
-            self.autosave_status_label.setStyleSheet("color: #ff6b6b; font-size: 11px;")
+            self.set_label_status(self.autosave_status_label, "warning")
+    
+    def set_label_status(self, label: QLabel, status: str):
+        """Recolor a status label via its "status" property (see STATUS_COLOR_STYLESHEET)."""
+        if label.property("status") == status:
+            return
+        label.setProperty("status", status)
+        # Re-polish so the stylesheet's property selectors are evaluated again
+        label.style().unpolish(label)
+        label.style().polish(label)
+    
+    def schedule_settings_save(self):
+        """Mark the settings as changed and write them once edits settle."""
+        self._settings_dirty = True
+        self.settings_save_timer.start(500)
+    
+    def flush_settings(self):
+        """Write pending settings changes to the settings file."""
+        self.settings_save_timer.stop()
+        if self._settings_dirty:
+            self._settings_dirty = False
+            self.app_settings.save_to_file(self.settings_file)
     
     def show_preferences(self):
         """Show preferences dialog."""
-        dialog = PreferencesDialog(self.app_settings, self)
+        # The dialog is built once and refilled from the current settings on reopen
+        dialog = self.preferences_dialog
+        if dialog is None:
+            dialog = self.preferences_dialog = PreferencesDialog(self.app_settings, self)
+        else:
+            dialog.settings = self.app_settings
+            dialog.load_settings()
+        
         if dialog.exec() == QDialog.Accepted:
             # Update settings
             self.app_settings = dialog.get_settings()
             
             # Save settings to file
-            self.app_settings.save_to_file(self.settings_file)
+            self.schedule_settings_save()
             
             # Restart autosave timer with new settings
             self.autosave_timer.stop()
@@ -677,7 +942,7 @@ class DecentSamplerMainWindow(QMainWindow):
         
         # Connect sample mapping changes to live XML updates
         if hasattr(self.sample_mapping, 'model'):
-            self.sample_mapping.model.dataChanged.connect(self.schedule_xml_update)
+            self.sample_mapping.model.dataChanged.connect(self.on_model_data_changed)
         
         
         return tab
@@ -710,21 +975,21 @@ class DecentSamplerMainWindow(QMainWindow):
         preset_layout.addWidget(QLabel("Library Name:"), 0, 0)
         self.preset_name_edit = QLineEdit()
         self.preset_name_edit.setPlaceholderText("Enter library name...")
-        self.preset_name_edit.textChanged.connect(self.schedule_xml_update)
+        self.preset_name_edit.editingFinished.connect(self.schedule_xml_update)
         preset_layout.addWidget(self.preset_name_edit, 0, 1)
         
         # Author
         preset_layout.addWidget(QLabel("Author:"), 1, 0)
         self.author_edit = QLineEdit()
         self.author_edit.setPlaceholderText("Enter author name...")
-        self.author_edit.textChanged.connect(self.schedule_xml_update)
+        self.author_edit.editingFinished.connect(self.schedule_xml_update)
         preset_layout.addWidget(self.author_edit, 1, 1)
         
         # Category
         preset_layout.addWidget(QLabel("Category:"), 2, 0)
         self.category_edit = QLineEdit()
         self.category_edit.setPlaceholderText("e.g., Piano, Strings, Drums...")
-        self.category_edit.textChanged.connect(self.schedule_xml_update)
+        self.category_edit.editingFinished.connect(self.schedule_xml_update)
         preset_layout.addWidget(self.category_edit, 2, 1)
         
         # Description
@@ -740,7 +1005,7 @@ class DecentSamplerMainWindow(QMainWindow):
         self.samples_path_edit = QLineEdit()
         self.samples_path_edit.setPlaceholderText("Samples")
         self.samples_path_edit.setText("Samples")  # Set default value
-        self.samples_path_edit.textChanged.connect(self.schedule_xml_update)
+        self.samples_path_edit.textEdited.connect(self.schedule_xml_update)
         preset_layout.addWidget(self.samples_path_edit, 4, 1)
         
         # Min Version
@@ -748,7 +1013,7 @@ class DecentSamplerMainWindow(QMainWindow):
         self.min_version_edit = QLineEdit()
         self.min_version_edit.setPlaceholderText("0 (omit if 0 or empty)")
         self.min_version_edit.setText("0")  # Set default value
-        self.min_version_edit.textChanged.connect(self.schedule_xml_update)
+        self.min_version_edit.textEdited.connect(self.schedule_xml_update)
         preset_layout.addWidget(self.min_version_edit, 5, 1)
         
         layout.addWidget(preset_group)
@@ -763,7 +1028,7 @@ class DecentSamplerMainWindow(QMainWindow):
         self.volume_edit = QLineEdit()
         self.volume_edit.setPlaceholderText("1.0 or 3dB")
         self.volume_edit.setText("1.0")  # Set default value
-        self.volume_edit.textChanged.connect(self.schedule_xml_update)
+        self.volume_edit.textEdited.connect(self.schedule_xml_update)
         groups_layout.addWidget(self.volume_edit, 0, 1)
         
         # Global Tuning
@@ -771,7 +1036,7 @@ class DecentSamplerMainWindow(QMainWindow):
         self.global_tuning_edit = QLineEdit()
         self.global_tuning_edit.setPlaceholderText("0.0 (semitones)")
         self.global_tuning_edit.setText("0.0")  # Set default value
-        self.global_tuning_edit.textChanged.connect(self.schedule_xml_update)
+        self.global_tuning_edit.textEdited.connect(self.schedule_xml_update)
         groups_layout.addWidget(self.global_tuning_edit, 1, 1)
         
         # Glide Time
@@ -779,7 +1044,7 @@ class DecentSamplerMainWindow(QMainWindow):
         self.glide_time_edit = QLineEdit()
         self.glide_time_edit.setPlaceholderText("0.0")
         self.glide_time_edit.setText("0.0")  # Set default value
-        self.glide_time_edit.textChanged.connect(self.schedule_xml_update)
+        self.glide_time_edit.textEdited.connect(self.schedule_xml_update)
         groups_layout.addWidget(self.glide_time_edit, 2, 1)
         
         # Glide Mode
@@ -810,7 +1075,7 @@ class DecentSamplerMainWindow(QMainWindow):
         self.global_seq_length_edit = QLineEdit()
         self.global_seq_length_edit.setPlaceholderText("0 (auto-detect)")
         self.global_seq_length_edit.setText("0")  # Set default value
-        self.global_seq_length_edit.textChanged.connect(self.schedule_xml_update)
+        self.global_seq_length_edit.textEdited.connect(self.schedule_xml_update)
         self.global_seq_length_edit.setEnabled(False)  # Start disabled
         groups_layout.addWidget(self.global_seq_length_edit, 6, 1)
         
@@ -838,7 +1103,7 @@ class DecentSamplerMainWindow(QMainWindow):
                 background-color: rgba(0, 0, 0, 0.2);
             }
         """)
-        self.sync_xml_btn.clicked.connect(self.update_xml_live)
+        self.sync_xml_btn.clicked.connect(self.force_xml_sync)
         sync_layout.addWidget(self.sync_xml_btn)
         layout.addLayout(sync_layout)
         
@@ -896,6 +1161,7 @@ class DecentSamplerMainWindow(QMainWindow):
         # XML editor with increased height
         self.xml_editor = XMLEditor()
         self.xml_editor.setMinimumHeight(600)  # Set minimum height to 600px
+        self.xml_editor.shown.connect(self.flush_xml_update)
         xml_layout.addWidget(self.xml_editor)
         
         layout.addWidget(xml_group)
@@ -926,46 +1192,80 @@ class DecentSamplerMainWindow(QMainWindow):
     
     def setup_connections(self):
         """Setup signal connections."""
-        # Connect preset property changes to live XML updates and mark as modified
-        self.preset_name_edit.textChanged.connect(self.schedule_xml_update)
-        self.preset_name_edit.textChanged.connect(self.mark_project_modified)
-        self.author_edit.textChanged.connect(self.schedule_xml_update)
-        self.author_edit.textChanged.connect(self.mark_project_modified)
-        self.category_edit.textChanged.connect(self.schedule_xml_update)
-        self.category_edit.textChanged.connect(self.mark_project_modified)
-        self.description_edit.textChanged.connect(self.schedule_xml_update)
+        # Connect preset property changes to mark as modified (live XML updates are
+        # connected in create_preset_tab). Line edits use textEdited so programmatic
+        # setText calls while loading or resetting a project don't fire them.
+        self.preset_name_edit.textEdited.connect(self.mark_project_modified)
+        self.author_edit.textEdited.connect(self.mark_project_modified)
+        self.category_edit.textEdited.connect(self.mark_project_modified)
         self.description_edit.textChanged.connect(self.mark_project_modified)
-        self.min_version_edit.textChanged.connect(self.schedule_xml_update)
-        self.min_version_edit.textChanged.connect(self.mark_project_modified)
+        self.min_version_edit.textEdited.connect(self.mark_project_modified)
         
         # Connect other UI changes to mark as modified
-        self.samples_path_edit.textChanged.connect(self.mark_project_modified)
-        self.volume_edit.textChanged.connect(self.mark_project_modified)
-        self.global_tuning_edit.textChanged.connect(self.mark_project_modified)
-        self.glide_time_edit.textChanged.connect(self.mark_project_modified)
+        self.samples_path_edit.textEdited.connect(self.mark_project_modified)
+        self.volume_edit.textEdited.connect(self.mark_project_modified)
+        self.global_tuning_edit.textEdited.connect(self.mark_project_modified)
+        self.glide_time_edit.textEdited.connect(self.mark_project_modified)
         self.glide_mode_combo.currentTextChanged.connect(self.mark_project_modified)
         self.global_round_robin_checkbox.toggled.connect(self.mark_project_modified)
         self.global_seq_mode_combo.currentTextChanged.connect(self.mark_project_modified)
-        self.global_seq_length_edit.textChanged.connect(self.mark_project_modified)
+        self.global_seq_length_edit.textEdited.connect(self.mark_project_modified)
+    
     
+    def on_model_data_changed(self, *args):
+        """Collect sample model changes and schedule one XML update after the burst."""
+        if not self.model_change_timer.isActive():
+            self.model_change_timer.start()
     
     def schedule_xml_update(self):
         """Schedule an XML update with a small delay to avoid excessive updates."""
-        self.update_timer.stop()
-        self.update_timer.start(300)  # 300ms delay
+        self.update_timer.start()  # Restarts the 300ms delay if already pending
     
     def mark_project_modified(self):
         """Mark the current project as modified."""
         if self.current_project:
+            was_modified = self.current_project.is_modified
             self.current_project.mark_modified()
-            self.update_window_title()
-            self.update_status_widgets()
+            if not was_modified:
+                # Show the unsaved marker right away
+                self.title_update_timer.stop()
+                self.update_window_title()
+            elif not self.title_update_timer.isActive():
+                self.title_update_timer.start()
+    
+    def force_xml_sync(self):
+        """Regenerate the XML preview even if none of its inputs changed."""
+        self._xml_cache_key = None
+        if self.xml_editor:
+            self.xml_editor.invalidate()
+        self.update_xml_live()
+    
+    def flush_xml_update(self):
+        """Run an XML update that was skipped while the preview was hidden."""
+        if self._xml_dirty:
+            self.update_xml_live()
     
     def update_xml_live(self):
         """Update the XML editor with current preset data."""
         if not self.xml_editor:
             return
         
+        # Nobody can see the preview, so regenerate it when it is shown again
+        if not self.xml_editor.isVisible():
+            self._xml_dirty = True
+            return
+        self._xml_dirty = False
+        
+        # Skip the rebuild when nothing that ends up in the XML has changed
+        header_inputs = self.get_xml_header_inputs()
+        groups_inputs = self.get_xml_groups_inputs()
+        samples_signature = self.get_xml_samples_signature()
+        cache_key = (header_inputs, groups_inputs, samples_signature)
+        previous_key = self._xml_cache_key
+        if cache_key == previous_key:
+            return
+        self._xml_cache_key = cache_key
+        
         try:
             # Check if we have samples from the mapping widget
             has_samples = False
@@ -973,6 +1273,7 @@ class DecentSamplerMainWindow(QMainWindow):
                 sample_groups = self.sample_mapping.get_sample_groups()
                 has_samples = len(sample_groups) > 0
             
+            xml_body = self._xml_body
             if not has_samples:
                 # Show empty preset XML with better formatting
                 xml_string = """<?xml version='1.0' encoding='UTF-8'?>
@@ -984,40 +1285,29 @@ class DecentSamplerMainWindow(QMainWindow):
     
   </groups>
 </DecentSampler>"""
+                xml_body = None
+            elif (xml_body is not None and previous_key is not None
+                  and samples_signature == previous_key[2]):
+                # Only the header and/or the <groups> attributes changed, so reuse
+                # the serialized groups instead of rebuilding the whole preset
+                if groups_inputs != previous_key[1]:
+                    xml_body = self.format_xml_groups_tag(dict(groups_inputs)) + xml_body.split("\n", 1)[1]
+                xml_string = self.format_xml_header(dict(header_inputs)) + xml_body
             else:
                 preset = self.create_preset()
-                
-                # Get global attributes from UI
-                global_volume = self.volume_edit.text() or "1.0"
-                global_tuning = self.global_tuning_edit.text() or "0.0"
-                glide_time = self.glide_time_edit.text() or "0.0"
-                glide_mode = self.glide_mode_combo.currentText() or "legato"
-                
-                # Only include global round robin settings if enabled
-                if self.global_round_robin_checkbox.isChecked():
-                    global_seq_mode = self.global_seq_mode_combo.currentText() or "always"
-                    global_seq_length = self.global_seq_length_edit.text() or "0"
-                else:
-                    global_seq_mode = "always"  # Default when disabled
-                    global_seq_length = "0"     # Default when disabled
-                
-                # Generate XML with global attributes
-                min_version = self.min_version_edit.text() or "0"
-                xml_tree = preset.to_xml(
-                    global_volume=global_volume,
-                    global_tuning=global_tuning,
-                    glide_time=glide_time,
-                    glide_mode=glide_mode,
-                    global_seq_mode=global_seq_mode,
-                    global_seq_length=global_seq_length,
-                    min_version=min_version,
-                    preset_name=self.preset_name_edit.text(),
-                    author=self.author_edit.text(),
-                    category=self.category_edit.text(),
-                    description=self.description_edit.toPlainText()
-                )
+                xml_tree = preset.to_xml(**dict(groups_inputs), **dict(header_inputs))
                 xml_string = self.format_xml(xml_tree)
+                
+                # Keep everything after the header for later header-only updates,
+                # as long as it starts with the <groups> line that can be patched
+                header = self.format_xml_header(dict(header_inputs))
+                xml_body = None
+                if xml_string.startswith(header):
+                    xml_body = xml_string[len(header):]
+                    if not xml_body.startswith("  <groups"):
+                        xml_body = None
             
+            self._xml_body = xml_body
             self.xml_editor.update_xml(xml_string)
             
         except Exception as e:
@@ -1031,6 +1321,70 @@ class DecentSamplerMainWindow(QMainWindow):
   </groups>
 </DecentSampler>"""
             self.xml_editor.update_xml(error_xml)
+            self._xml_cache_key = None  # Retry on the next update
+            self._xml_body = None
+    
+    def get_xml_header_inputs(self) -> tuple:
+        """Get the (name, value) pairs of the preset header fields for to_xml."""
+        return (
+            ("min_version", self.min_version_edit.text() or "0"),
+            ("preset_name", self.preset_name_edit.text()),
+            ("author", self.author_edit.text()),
+            ("category", self.category_edit.text()),
+            ("description", self.description_edit.toPlainText()),
+        )
+    
+    def get_xml_groups_inputs(self) -> tuple:
+        """Get the (name, value) pairs of the global <groups> attributes for to_xml."""
+        # Only include global round robin settings if enabled
+        if self.global_round_robin_checkbox.isChecked():
+            global_seq_mode = self.global_seq_mode_combo.currentText() or "always"
+            global_seq_length = self.global_seq_length_edit.text() or "0"
+        else:
+            global_seq_mode = "always"  # Default when disabled
+            global_seq_length = "0"     # Default when disabled
+        
+        return (
+            ("global_volume", self.volume_edit.text() or "1.0"),
+            ("global_tuning", self.global_tuning_edit.text() or "0.0"),
+            ("glide_time", self.glide_time_edit.text() or "0.0"),
+            ("glide_mode", self.glide_mode_combo.currentText() or "legato"),
+            ("global_seq_mode", global_seq_mode),
+            ("global_seq_length", global_seq_length),
+        )
+    
+    def get_xml_samples_signature(self) -> tuple:
+        """Get a value that changes whenever the sample part of the XML may have changed."""
+        if hasattr(self, 'sample_mapping'):
+            groups_signature = self.sample_mapping.get_sample_groups_signature()
+        else:
+            groups_signature = None
+        return (self.samples_path_edit.text(), groups_signature)
+    
+    def format_xml_header(self, header_inputs: dict) -> str:
+        """Format the declaration, root tag and preset comments as format_xml does."""
+        from lxml import etree
+        
+        root_tag = etree.tostring(
+            etree.Element("DecentSampler", DecentPreset.root_attributes(header_inputs["min_version"])),
+            encoding='unicode'
+        )
+        lines = ["<?xml version='1.0' encoding='UTF-8'?>", root_tag[:-2] + ">"]
+        for text in DecentPreset.header_comments(header_inputs["preset_name"], header_inputs["author"],
+                                                 header_inputs["category"], header_inputs["description"]):
+            lines.append("  " + etree.tostring(etree.Comment(text), encoding='unicode'))
+        lines.append("")
+        return "\n".join(lines)
+    
+    def format_xml_groups_tag(self, groups_inputs: dict) -> str:
+        """Format the opening <groups> line as format_xml does."""
+        from lxml import etree
+        
+        groups_tag = etree.tostring(
+            etree.Element("groups", DecentPreset.groups_attributes(**groups_inputs)),
+            encoding='unicode'
+        )
+        return "  " + groups_tag[:-2] + ">\n"
     
     def format_xml(self, xml_tree) -> str:
         """Format XML tree to string with proper indentation."""
@@ -1139,85 +1493,43 @@ class DecentSamplerMainWindow(QMainWindow):
             return
         
         try:
-            import zipfile
-            import tempfile
-            import shutil
-            from pathlib import Path
+            import zipfile  # Only needed when exporting, so kept off the startup path
+            from lxml import etree
             
-            # Create temporary directory for package contents
-            with tempfile.TemporaryDirectory() as temp_dir:
-                temp_path = Path(temp_dir)
-                
-                # Create Samples directory
-                samples_dir = temp_path / "Samples"
-                samples_dir.mkdir()
-                
-                # Copy all sample files to Samples directory
-                sample_files = []
-                for sample_group in self.sample_mapping.get_sample_groups():
-                    for sample in sample_group.samples:
-                        if sample.file_path.exists():
-                            dest_path = samples_dir / sample.file_path.name
-                            shutil.copy2(sample.file_path, dest_path)
-                            sample_files.append(sample.file_path.name)
-                
-                if not sample_files:
-                    QMessageBox.warning(self, "No Sample Files", "No sample files found to include in package.")
-                    return
-                
-                # Create preset file
-                preset = self.create_preset()
-                
-                # Get global attributes from UI
-                global_volume = self.volume_edit.text() or "1.0"
-                global_tuning = self.global_tuning_edit.text() or "0.0"
-                glide_time = self.glide_time_edit.text() or "0.0"
-                glide_mode = self.glide_mode_combo.currentText() or "legato"
-                
-                # Only include global round robin settings if enabled
-                if self.global_round_robin_checkbox.isChecked():
-                    global_seq_mode = self.global_seq_mode_combo.currentText() or "always"
-                    global_seq_length = self.global_seq_length_edit.text() or "0"
-                else:
-                    global_seq_mode = "always"  # Default when disabled
-                    global_seq_length = "0"     # Default when disabled
-                
-                # Generate XML with global attributes
-                min_version = self.min_version_edit.text() or "0"
-                xml_tree = preset.to_xml(
-                    global_volume=global_volume,
-                    global_tuning=global_tuning,
-                    glide_time=glide_time,
-                    glide_mode=glide_mode,
-                    global_seq_mode=global_seq_mode,
-                    global_seq_length=global_seq_length,
-                    min_version=min_version,
-                    preset_name=self.preset_name_edit.text(),
-                    author=self.author_edit.text(),
-                    category=self.category_edit.text(),
-                    description=self.description_edit.toPlainText()
-                )
-                
-                # Save preset file
-                preset_file = temp_path / f"{self.preset_name_edit.text()}.dspreset"
-                xml_tree.write(preset_file, encoding='utf-8', xml_declaration=False, pretty_print=True)
-                
-                # Create ZIP file
-                with zipfile.ZipFile(file_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                    # Add preset file
-                    zipf.write(preset_file, preset_file.name)
-                    
-                    # Add all sample files
-                    for sample_file in sample_files:
-                        sample_path = samples_dir / sample_file
-                        zipf.write(sample_path, f"Samples/{sample_file}")
+            # Collect sample files by archive name; like copying them into one
+            # Samples folder, a later file with the same name replaces an earlier one
+            sample_files = {}
+            for sample_group in self.sample_mapping.get_sample_groups():
+                for sample in sample_group.samples:
+                    if sample.file_path.exists():
+                        sample_files[sample.file_path.name] = sample.file_path
+            
+            if not sample_files:
+                QMessageBox.warning(self, "No Sample Files", "No sample files found to include in package.")
+                return
+            
+            # Create preset file with global attributes from UI
+            preset = self.create_preset()
+            xml_tree = preset.to_xml(**dict(self.get_xml_groups_inputs()), **dict(self.get_xml_header_inputs()))
+            preset_name = f"{self.preset_name_edit.text()}.dspreset"
+            preset_data = etree.tostring(xml_tree, encoding='utf-8', xml_declaration=False, pretty_print=True)
+            
+            # Audio barely compresses, so samples are stored and streamed straight
+            # from their source files; only the preset text is deflated
+            with zipfile.ZipFile(file_path, 'w', zipfile.ZIP_STORED, allowZip64=True) as zipf:
+                # Add preset file
+                zipf.writestr(preset_name, preset_data, compress_type=zipfile.ZIP_DEFLATED, compresslevel=1)
                 
-                self.statusBar().showMessage(f"Package exported to: {file_path}")
-                QMessageBox.information(self, "Success", 
-                    f"Package exported successfully to:\n{file_path}\n\n"
-                    f"Includes:\n"
-                    f"- {preset_file.name}\n"
-                    f"- {len(sample_files)} sample files in Samples/ folder")
+                # Add all sample files
+                for sample_file, sample_path in sample_files.items():
+                    zipf.write(sample_path, f"Samples/{sample_file}")
+            
+            self.statusBar().showMessage(f"Package exported to: {file_path}")
+            QMessageBox.information(self, "Success", 
+                f"Package exported successfully to:\n{file_path}\n\n"
+                f"Includes:\n"
+                f"- {preset_name}\n"
+                f"- {len(sample_files)} sample files in Samples/ folder")
         
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to export package:\n{str(e)}")
@@ -1255,8 +1567,21 @@ class DecentSamplerMainWindow(QMainWindow):
     def autosave_project(self):
         """Perform autosave if needed."""
         if self.current_project and self.current_project.is_autosave_needed():
-            self.current_project.create_autosave()
-            self.current_project.cleanup_autosaves()
+            # Serialize here, where the project cannot change underneath us, and
+            # leave the file write and the cleanup of old autosaves to a worker
+            try:
+                autosave_path, autosave_text = self.current_project.serialize_autosave()
+            except Exception as e:
+                print(f"Error creating autosave: {e}")
+                return
+            worker = AutosaveWorker(self.current_project, autosave_path, autosave_text)
+            worker.signals.finished.connect(self.autosave_finished)
+            QThreadPool.globalInstance().start(worker)
+    
+    def autosave_finished(self, success: bool):
+        """Record a written autosave; a failed one is retried on the next tick."""
+        if success and self.current_project:
+            self.current_project.mark_autosaved()
     
     def check_for_recovery_files(self):
         """Check for recovery files and prompt user if found."""
@@ -1494,6 +1819,7 @@ class DecentSamplerMainWindow(QMainWindow):
         if not file_path.exists():
             QMessageBox.warning(self, "File Not Found", f"The project file does not exist:\n{file_path}")
             self.app_settings.remove_recent_project(str(file_path))
+            self.schedule_settings_save()
             self.update_recent_projects_menu()
             return
         
@@ -1517,6 +1843,7 @@ class DecentSamplerMainWindow(QMainWindow):
             
             # Add to recent projects
             self.app_settings.add_recent_project(str(file_path))
+            self.schedule_settings_save()
             
             # Update UI
             self.update_window_title()
@@ -1582,6 +1909,7 @@ class DecentSamplerMainWindow(QMainWindow):
             if self.current_project.save():
                 # Add to recent projects
                 self.app_settings.add_recent_project(str(file_path))
+                self.schedule_settings_save()
                 
                 # Update UI
                 self.update_window_title()
@@ -1609,6 +1937,7 @@ class DecentSamplerMainWindow(QMainWindow):
         
         if reply == QMessageBox.Yes:
             self.app_settings.recent_projects.clear()
+            self.schedule_settings_save()
             self.update_recent_projects_menu()
             self.statusBar().showMessage("Recent projects cleared")
     
@@ -1687,7 +2016,8 @@ class DecentSamplerMainWindow(QMainWindow):
         self.preset_name_edit.clear()
         self.author_edit.clear()
         self.category_edit.clear()
-        self.description_edit.clear()
+        with QSignalBlocker(self.description_edit):
+            self.description_edit.clear()
         self.samples_path_edit.setText("Samples")
         self.min_version_edit.setText("0")
         
@@ -1725,7 +2055,8 @@ class DecentSamplerMainWindow(QMainWindow):
         self.preset_name_edit.setText(preset.preset_name)
         self.author_edit.setText(preset.author)
         self.category_edit.setText(preset.category)
-        self.description_edit.setPlainText(preset.description)
+        with QSignalBlocker(self.description_edit):
+            self.description_edit.setPlainText(preset.description)
         self.samples_path_edit.setText(preset.samples_path)
         
         # Load UI state
@@ -1800,6 +2131,9 @@ class DecentSamplerMainWindow(QMainWindow):
         if self.check_unsaved_changes():
             event.ignore()
         else:
+            # Let a background autosave finish before writing the final one
+            QThreadPool.globalInstance().waitForDone()
+            
             # Create final autosave if project is modified
             if self.current_project and self.current_project.is_modified:
                 try:
@@ -1808,7 +2142,8 @@ class DecentSamplerMainWindow(QMainWindow):
                     print(f"Error creating final autosave: {e}")
             
             # Save settings before closing
-            self.app_settings.save_to_file(self.settings_file)
+            self._settings_dirty = True
+            self.flush_settings()
             event.accept()
 
 
@@ -9,13 +9,11 @@ This module provides project file functionality including:
 """
 
 import json
-import pickle
 import os
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Union
 from datetime import datetime
 import tempfile
-import shutil
 
 from decent_sampler import DecentPreset, SampleGroup, Sample
 
@@ -156,6 +154,7 @@ class ProjectSettings:
         self.window_geometry: Optional[Dict[str, int]] = None
         self.last_samples_directory: Optional[str] = None
         self.last_export_directory: Optional[str] = None
+        self.last_autosave_browse_directory: Optional[str] = None
     
     def add_recent_project(self, project_path: str):
         """Add a project to recent projects list."""
@@ -184,11 +183,15 @@ class ProjectSettings:
         self.recent_projects = [p for p in self.recent_projects if Path(p).exists()]
     
     def save_to_file(self, file_path: Path):
-        """Save settings to a file."""
+        """Save settings to a file, replacing it atomically."""
         try:
             settings_data = self.to_dict()
-            with open(file_path, 'w', encoding='utf-8') as f:
+            # Write next to the target and swap it in, so a crash mid-write
+            # never leaves a truncated settings file behind
+            temp_path = Path(str(file_path) + ".tmp")
+            with open(temp_path, 'w', encoding='utf-8') as f:
                 json.dump(settings_data, f, indent=2, ensure_ascii=False)
+            os.replace(temp_path, file_path)
         except Exception as e:
             print(f"Error saving settings: {e}")
     
@@ -217,7 +220,8 @@ class ProjectSettings:
             'temp_directory': str(self.temp_directory),
             'window_geometry': self.window_geometry,
             'last_samples_directory': self.last_samples_directory,
-            'last_export_directory': self.last_export_directory
+            'last_export_directory': self.last_export_directory,
+            'last_autosave_browse_directory': self.last_autosave_browse_directory
         }
     
     @classmethod
@@ -232,6 +236,7 @@ class ProjectSettings:
         settings.window_geometry = data.get('window_geometry')
         settings.last_samples_directory = data.get('last_samples_directory')
         settings.last_export_directory = data.get('last_export_directory')
+        settings.last_autosave_browse_directory = data.get('last_autosave_browse_directory')
         return settings
 
 
@@ -655,26 +660,55 @@ class Project:
             return False
         
         try:
-            # Ensure temp directory exists
-            self.settings.temp_directory.mkdir(parents=True, exist_ok=True)
-            
-            # Create autosave filename with timestamp
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            autosave_name = f"autosave_{timestamp}.dsproj"
-            self.autosave_path = self.settings.temp_directory / autosave_name
-            
-            # Save autosave copy
-            autosave_data = self.to_dict()
-            with open(self.autosave_path, 'w', encoding='utf-8') as f:
-                json.dump(autosave_data, f, indent=2, ensure_ascii=False)
-            
-            self.last_autosave = datetime.now()
+            autosave_path, autosave_text = self.serialize_autosave()
+            self.write_autosave_file(autosave_path, autosave_text)
+            self.mark_autosaved()
             return True
             
         except Exception as e:
             print(f"Error creating autosave: {e}")
             return False
     
+    def serialize_autosave(self) -> tuple:
+        """
+        Claim a new autosave path and serialize the project for it.
+        
+        This snapshots the project, so the result can be written from another
+        thread with write_autosave_file while the project keeps changing.
+        
+        Returns:
+            Tuple of (autosave path, project JSON text)
+        """
+        # Create autosave filename with timestamp
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        autosave_name = f"autosave_{timestamp}.dsproj"
+        self.autosave_path = self.settings.temp_directory / autosave_name
+        
+        autosave_text = json.dumps(self.to_dict(), indent=2, ensure_ascii=False)
+        return self.autosave_path, autosave_text
+    
+    @staticmethod
+    def write_autosave_file(autosave_path: Path, autosave_text: str):
+        """
+        Write serialized autosave text, replacing the file atomically.
+        
+        Args:
+            autosave_path: Path of the autosave file
+            autosave_text: Project JSON from serialize_autosave
+        """
+        # Ensure temp directory exists
+        autosave_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        # A crash mid-write leaves only the .tmp file, never a truncated autosave
+        temp_path = Path(str(autosave_path) + ".tmp")
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(autosave_text)
+        os.replace(temp_path, autosave_path)
+    
+    def mark_autosaved(self):
+        """Record that an autosave was just made."""
+        self.last_autosave = datetime.now()
+    
     def cleanup_autosaves(self, keep_recent: int = 5):
         """
         Clean up old autosave files, keeping only the most recent ones.
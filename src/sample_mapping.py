@@ -8,25 +8,221 @@ This module provides a comprehensive sample mapping interface with:
 """
 
 import re
+import sys
+from bisect import bisect_right
+from collections import defaultdict
+from contextlib import contextmanager
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterable
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QTableView, QHeaderView,
     QAbstractItemView, QLabel, QPushButton, QGroupBox, QSplitter,
     QMessageBox, QApplication, QSizePolicy, QProgressDialog,
     QComboBox, QSpinBox, QStyledItemDelegate, QCheckBox,
     QDialog, QDialogButtonBox, QLineEdit, QDoubleSpinBox,
-    QListWidget, QListWidgetItem, QRadioButton, QButtonGroup,
+    QListWidget, QListWidgetItem, QListView, QRadioButton, QButtonGroup,
     QSlider, QTreeWidget, QTreeWidgetItem, QFrame, QStyle
 )
 from PySide6.QtCore import (
     Qt, QAbstractTableModel, QModelIndex, Signal, QMimeData,
-    QRectF, QPointF, QSize, QRect, QUrl
+    QRectF, QPointF, QSize, QRect, QUrl, QTimer, QSignalBlocker
 )
 from PySide6.QtGui import QFont, QPainterPath, QDrag, QPixmap, QPainter, QColor, QBrush, QPen, QDragEnterEvent, QDropEvent
 
 from decent_sampler import DecentPreset, SampleGroup, Sample
 
+# Audio file extensions accepted by drag and drop
+_AUDIO_SUFFIXES = frozenset({'.wav', '.aif', '.aiff', '.flac', '.mp3'})
+
+# Imports smaller than this are auto-mapped without a progress dialog
+_PROGRESS_DIALOG_MIN_SAMPLES = 16
+
+# Number of samples auto-mapped between progress dialog value/label updates
+_PROGRESS_UPDATE_INTERVAL = 64
+
+# Sequence mode names. Interned so values coming back from Qt widgets
+# (e.g. QComboBox.currentText()) share the same string objects.
+MODE_ALWAYS = sys.intern("always")
+MODE_RANDOM = sys.intern("random")
+MODE_TRUE_RANDOM = sys.intern("true_random")
+MODE_ROUND_ROBIN = sys.intern("round_robin")
+
+# Sequence mode <-> RoundRobinDialog mode button id
+_MODE_TO_ID = {MODE_ALWAYS: 0, MODE_RANDOM: 1, MODE_TRUE_RANDOM: 2, MODE_ROUND_ROBIN: 3}
+_ID_TO_MODE = {mode_id: mode for mode, mode_id in _MODE_TO_ID.items()}
+
+# Sequence modes that make a sample or group part of a round robin
+RR_MODES = frozenset((MODE_RANDOM, MODE_TRUE_RANDOM, MODE_ROUND_ROBIN))
+
+# Note names in order starting from C
+_NOTE_LETTERS = ('C', 'C#', 'D', 'D#', 'E', 'F', 'F#', 'G', 'G#', 'A', 'A#', 'B')
+
+# Names for every MIDI note (0 -> C-1, 60 -> C4, 127 -> G9)
+_NOTE_NAME_TABLE = tuple(f"{_NOTE_LETTERS[note % 12]}{(note // 12) - 1}" for note in range(128))
+
+# Note + octave patterns used to extract root notes from (upper-cased) filenames
+_NOTE_PATTERNS = (
+    re.compile(r'([A-G]#?b?)(\d+)'),  # C4, A#3, Bb2
+    re.compile(r'([A-G])(\d+)'),      # C4, A3
+    re.compile(r'([A-G]#?)(\d+)'),    # C#4, A3
+)
+
+# Semitone offset from C for each (upper-cased) note name
+_NOTE_SEMITONES = {
+    'C': 0, 'C#': 1, 'DB': 1, 'D': 2, 'D#': 3, 'EB': 3,
+    'E': 4, 'F': 5, 'F#': 6, 'GB': 6, 'G': 7, 'G#': 8,
+    'AB': 8, 'A': 9, 'A#': 10, 'BB': 10, 'B': 11
+}
+
+# Drum keyword -> (pattern, base MIDI note), dispatched on the keyword being present
+_DRUM_PATTERNS = {
+    'KICK': (re.compile(r'KICK.*?C?(\d+)'), 36),    # Kick_C1 -> C1 (36)
+    'SNARE': (re.compile(r'SNARE.*?C?(\d+)'), 38),  # Snare_C2 -> C2 (38)
+    'HAT': (re.compile(r'HAT.*?C?(\d+)'), 42),      # Hat_C3 -> C3 (42)
+}
+
+# Common round robin filename suffixes (matched against the lower-cased stem),
+# fused into one pattern: _rr1, _1, _round1, _alt1, _var1, etc.
+_RR_COMBINED = re.compile(r'_(?:rr|round|alt|var)?(\d+)$')
+_RR_PREFIXES = frozenset(('', 'rr', 'round', 'alt', 'var'))
+
+# Round robin suffixes used by the round robin manager's auto-detection.
+# _RR_BASE strips the same chain of suffixes that removing _rr1, _1, _round1,
+# _alt1, _var1 and #1 one after another from the end would, in a single pass.
+_RR_BASE = re.compile(
+    r'(?:#\d+)?(?:_var\d+)?(?:_alt\d+)?(?:_round\d+)?(?:_\d+)?(?:_rr\d+)?$',
+    re.IGNORECASE
+)
+# At most one of C4#1, _rr1, _1, _round1, _alt1 or _var1 can end a name
+_RR_POSITION = re.compile(r'(?:#|_(?:rr|round|alt|var)?)(\d+)$', re.IGNORECASE)
+
+
+def _note_name(note: int) -> str:
+    """Convert a MIDI note number to a note name (e.g., 60 -> C4)."""
+    if 0 <= note < 128:
+        return _NOTE_NAME_TABLE[note]
+    return f"{_NOTE_LETTERS[note % 12]}{(note // 12) - 1}"
+
+
+@lru_cache(maxsize=8192)
+def _extract_root_note(filename: str) -> Optional[int]:
+    """Extract root note from filename using common patterns (memoized by filename)."""
+    # Remove file extension
+    name = Path(filename).stem.upper()
+    
+    # Pattern 1: Note + Octave (e.g., "C4", "A#3", "Bb2")
+    for pattern in _NOTE_PATTERNS:
+        match = pattern.search(name)
+        if match:
+            note_name = match.group(1)
+            octave = int(match.group(2))
+            
+            # Convert note name to MIDI number
+            if note_name in _NOTE_SEMITONES:
+                midi_note = 12 + (octave * 12) + _NOTE_SEMITONES[note_name]
+                if 21 <= midi_note <= 108:  # Valid piano range
+                    return midi_note
+    
+    # Pattern 2: Kick, Snare, etc. with octave.
+    # Only run the patterns whose keyword actually appears in the name.
+    for keyword, (pattern, base_note) in _DRUM_PATTERNS.items():
+        if keyword not in name:
+            continue
+        match = pattern.search(name)
+        if match:
+            octave = int(match.group(1))
+            midi_note = 12 + (octave * 12) + (base_note % 12)
+            if 21 <= midi_note <= 108:
+                return midi_note
+    
+    return None
+
+
+@lru_cache(maxsize=8192)
+def _sample_display_text(file_name: str, root_note: int) -> str:
+    """Get the "name (Note: n)" list label for a sample (memoized by name and note)."""
+    return f"{file_name} (Note: {root_note})"
+
+
+# Shared stylesheet for the round robin dialog/manager buttons, installed once on
+# the application (see install_round_robin_stylesheet) instead of being parsed
+# per widget every time a dialog is built
+ROUND_ROBIN_STYLESHEET = """
+QPushButton#rrAddSampleBtn {
+    border-radius: 15px;
+    padding: 8px 16px;
+    font-weight: bold;
+    background-color: #e8f5e8;
+    border: 2px solid #4caf50;
+    color: #000000;
+}
+QPushButton#rrAddSampleBtn:hover {
+    background-color: #c8e6c9;
+    color: #ffffff;
+    border: 3px solid #388e3c;
+    font-size: 13px;
+}
+QPushButton#rrAddSampleBtn:pressed {
+    background-color: #a5d6a7;
+    color: #ffffff;
+    border: 3px solid #2e7d32;
+}
+
+QPushButton#rrRemoveSampleBtn {
+    border-radius: 15px;
+    padding: 8px 16px;
+    font-weight: bold;
+    background-color: #ffebee;
+    border: 2px solid #f44336;
+    color: #000000;
+}
+QPushButton#rrRemoveSampleBtn:hover {
+    background-color: #ffcdd2;
+    color: #ffffff;
+    border: 3px solid #d32f2f;
+    font-size: 13px;
+}
+QPushButton#rrRemoveSampleBtn:pressed {
+    background-color: #ef9a9a;
+    color: #ffffff;
+    border: 3px solid #c62828;
+}
+
+QPushButton#rrAddGroupBtn {
+    font-size: 14px;
+    font-weight: bold;
+    padding: 8px 20px;
+    border-radius: 6px;
+    background-color: #e3f2fd;
+    border: 2px solid #2196f3;
+    color: #000000;
+}
+QPushButton#rrAddGroupBtn:hover {
+    background-color: #bbdefb;
+    border: 3px solid #1976d2;
+}
+QPushButton#rrAddGroupBtn:pressed {
+    background-color: #90caf9;
+    border: 3px solid #1565c0;
+}
+"""
+
+_round_robin_stylesheet_installed = False
+
+
+def install_round_robin_stylesheet():
+    """Append the round robin button styles to the application stylesheet (once)."""
+    global _round_robin_stylesheet_installed
+    if _round_robin_stylesheet_installed:
+        return
+    app = QApplication.instance()
+    if app is None:
+        return
+    app.setStyleSheet(app.styleSheet() + ROUND_ROBIN_STYLESHEET)
+    _round_robin_stylesheet_installed = True
+
 
 class GroupEditDialog(QDialog):
     """Dialog for editing group attributes."""
@@ -139,6 +335,9 @@ class SampleGroupModel(QAbstractTableModel):
         self.sample_groups = sample_groups or []
         self.samples = []  # Flattened list of all samples
         self.sample_to_group = {}  # Map sample to group
+        self._sample_to_row = {}  # Map id(sample) to row, rebuilt lazily when stale
+        self._batch_depth = 0  # Nesting depth of batch_update() blocks
+        self._batch_changed = False  # A broadcast was deferred by batch_update()
         self._build_sample_list()
     
     def _build_sample_list(self):
@@ -182,7 +381,7 @@ class SampleGroupModel(QAbstractTableModel):
         
         if role == Qt.DisplayRole or role == Qt.EditRole:
             if attribute == "file_path":
-                return sample.file_path.name  # Show only filename
+                return sample.file_name  # Show only filename
             elif attribute == "group_name":
                 # Get group name for this sample
                 group = self.sample_to_group.get(sample)
@@ -195,11 +394,11 @@ class SampleGroupModel(QAbstractTableModel):
             elif attribute == "has_round_robin":
                 # Check if sample is in a round robin group or has individual round robin settings
                 group = self.sample_to_group.get(sample)
-                if group and hasattr(group, 'seq_mode') and group.seq_mode in ['random', 'true_random', 'round_robin']:
+                if group and hasattr(group, 'seq_mode') and group.seq_mode in RR_MODES:
                     return "Yes (Group)"
                 else:
-                    seq_mode = getattr(sample, 'seq_mode', 'always')
-                    return "Yes" if seq_mode in ['random', 'true_random', 'round_robin'] else "No"
+                    seq_mode = getattr(sample, 'seq_mode', MODE_ALWAYS)
+                    return "Yes" if seq_mode in RR_MODES else "No"
             else:
                 return getattr(sample, attribute)
         elif role == Qt.TextAlignmentRole:
@@ -217,9 +416,9 @@ class SampleGroupModel(QAbstractTableModel):
             # Highlight round robin samples
             elif attribute == 'has_round_robin':
                 group = self.sample_to_group.get(sample)
-                if group and hasattr(group, 'seq_mode') and group.seq_mode in ['random', 'true_random', 'round_robin']:
+                if group and hasattr(group, 'seq_mode') and group.seq_mode in RR_MODES:
                     return QColor(255, 240, 200)  # Light orange for round robin group
-                elif hasattr(sample, 'seq_mode') and sample.seq_mode in ['random', 'true_random', 'round_robin']:
+                elif hasattr(sample, 'seq_mode') and sample.seq_mode in RR_MODES:
                     return QColor(255, 240, 200)  # Light orange for individual round robin
         elif role == Qt.ForegroundRole:
             if attribute == "file_path":
@@ -229,14 +428,14 @@ class SampleGroupModel(QAbstractTableModel):
         elif role == Qt.ToolTipRole:
             if attribute == "has_round_robin":
                 group = self.sample_to_group.get(sample)
-                if group and hasattr(group, 'seq_mode') and group.seq_mode in ['random', 'true_random', 'round_robin']:
+                if group and hasattr(group, 'seq_mode') and group.seq_mode in RR_MODES:
                     length = getattr(group, 'seq_length', 0)
                     length_str = str(length) if length > 0 else "Auto"
                     position = getattr(sample, 'seq_position', 1)
                     return f"Round Robin Group: {group.name}\nMode: {group.seq_mode}\nPosition: {position}\nLength: {length_str}\n\nConfigure in Round Robin by Group tab"
                 else:
-                    seq_mode = getattr(sample, 'seq_mode', 'always')
-                    if seq_mode in ['random', 'true_random', 'round_robin']:
+                    seq_mode = getattr(sample, 'seq_mode', MODE_ALWAYS)
+                    if seq_mode in RR_MODES:
                         position = getattr(sample, 'seq_position', 1)
                         length = getattr(sample, 'seq_length', 0)
                         length_str = str(length) if length > 0 else "Auto"
@@ -338,6 +537,15 @@ class SampleGroupModel(QAbstractTableModel):
             self.beginResetModel()
             self.endResetModel()
     
+    def append_samples(self, new_samples: List[Sample]):
+        """Append new (ungrouped) samples as a single block of inserted rows."""
+        if not new_samples:
+            return
+        first_row = len(self.samples)
+        self.beginInsertRows(QModelIndex(), first_row, first_row + len(new_samples) - 1)
+        self.samples.extend(new_samples)
+        self.endInsertRows()
+    
     def create_group(self, name: str, samples: List[Sample] = None):
         """Create a new group with given samples."""
         group = SampleGroup(name=name, samples=samples or [])
@@ -361,7 +569,7 @@ class SampleGroupModel(QAbstractTableModel):
         # Add to new group
         group.add_sample(sample)
         self.sample_to_group[sample] = group
-        self.dataChanged.emit(self.createIndex(0, 0), self.createIndex(self.rowCount() - 1, self.columnCount() - 1), [])
+        self.emit_all_changed()
     
     def remove_sample_from_group(self, sample: Sample):
         """Remove a sample from its group, making it ungrouped."""
@@ -369,12 +577,54 @@ class SampleGroupModel(QAbstractTableModel):
         if group:
             group.remove_sample(sample)
             del self.sample_to_group[sample]
-            self.dataChanged.emit(self.createIndex(0, 0), self.createIndex(self.rowCount() - 1, self.columnCount() - 1), [])
+            self.emit_all_changed()
+    
+    def remove_samples_from_groups(self, samples: List[Sample]):
+        """Remove several samples from their groups, one pass per affected group."""
+        removed_by_group = defaultdict(set)
+        for sample in samples:
+            group = self.sample_to_group.pop(sample, None)
+            if group:
+                removed_by_group[group].add(sample)
+        
+        for group, removed in removed_by_group.items():
+            group.remove_many(removed)
+        
+        if removed_by_group:
+            self.emit_all_changed()
+    
+    def emit_all_changed(self):
+        """Broadcast that every cell may have changed (deferred inside batch_update)."""
+        if self._batch_depth:
+            self._batch_changed = True
+            return
+        self.dataChanged.emit(self.createIndex(0, 0), self.createIndex(self.rowCount() - 1, self.columnCount() - 1), [])
+    
+    @contextmanager
+    def batch_update(self):
+        """Coalesce whole-model broadcasts from several edits into one on exit."""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._batch_changed:
+                self._batch_changed = False
+                self.emit_all_changed()
     
     def get_selected_samples(self) -> List[Sample]:
         """Get all selected samples."""
         return [sample for sample in self.samples if sample.selected]
     
+    def get_sample_row(self, sample: Sample) -> int:
+        """Get the row of a sample, or -1 if it is not in the model."""
+        row = self._sample_to_row.get(id(sample))
+        if row is None or row >= len(self.samples) or self.samples[row] is not sample:
+            # The sample list changed since the index was built - rebuild it
+            self._sample_to_row = {id(s): i for i, s in enumerate(self.samples)}
+            row = self._sample_to_row.get(id(sample), -1)
+        return row
+    
     def headerData(self, section, orientation, role=Qt.DisplayRole):
         """Return header data for the given section and orientation."""
         if role == Qt.DisplayRole:
@@ -394,7 +644,7 @@ class SampleGroupModel(QAbstractTableModel):
         # Define sorting key function
         def sort_key(sample):
             if attribute == "file_path":
-                return sample.file_path.name.lower()
+                return sample.file_name.lower()
             elif attribute in ["root_note", "low_note", "high_note"]:
                 return getattr(sample, attribute)
             elif attribute == "selected":
@@ -412,18 +662,7 @@ class SampleGroupModel(QAbstractTableModel):
     
     def get_note_name(self, note_num: int) -> str:
         """Convert MIDI note number to note name (e.g., 60 -> C4)."""
-        # Note names in order starting from C
-        note_names = ['C', 'C#', 'D', 'D#', 'E', 'F', 'F#', 'G', 'G#', 'A', 'A#', 'B']
-        
-        # Calculate octave and note within octave
-        octave = (note_num - 12) // 12
-        note_in_octave = (note_num - 12) % 12
-        
-        # Get note name
-        note_name = note_names[note_in_octave]
-        
-        # Return formatted note name
-        return f"{note_name}{octave}"
+        return _note_name(note_num)
     
     def parse_note_name(self, note_name: str) -> Optional[int]:
         """Convert note name to MIDI number (e.g., 'C4' -> 60)."""
@@ -529,12 +768,11 @@ class NoteNameDelegate(QStyledItemDelegate):
     def generate_note_names(self):
         """Generate list of note names from A0 to C8, sorted by pitch (MIDI number)."""
         note_names = []
-        note_letters = ['C', 'C#', 'D', 'D#', 'E', 'F', 'F#', 'G', 'G#', 'A', 'A#', 'B']
         
         # Generate all notes with their MIDI numbers
         notes_with_midi = []
         for octave in range(9):  # 0 to 8
-            for note_letter in note_letters:
+            for note_letter in _NOTE_LETTERS:
                 note_name = f"{note_letter}{octave}"
                 midi_number = self.parse_note_name(note_name)
                 if midi_number is not None:
@@ -999,18 +1237,7 @@ class VisualKeyboard(QWidget):
     
     def get_note_name(self, note_num: int) -> str:
         """Convert MIDI note number to note name (e.g., 60 -> C4)."""
-        # Note names in order starting from C
-        note_names = ['C', 'C#', 'D', 'D#', 'E', 'F', 'F#', 'G', 'G#', 'A', 'A#', 'B']
-        
-        # Calculate octave and note within octave
-        octave = (note_num - 12) // 12
-        note_in_octave = (note_num - 12) % 12
-        
-        # Get note name
-        note_name = note_names[note_in_octave]
-        
-        # Return formatted note name
-        return f"{note_name}{octave}"
+        return _note_name(note_num)
     
     def paintEvent(self, event):
         """Paint the piano keyboard."""
@@ -1195,6 +1422,24 @@ class SampleMappingWidget(QWidget):
         super().__init__(parent)
         self.sample_groups = []
         self.setAcceptDrops(True)  # Enable drag and drop
+
+        # Coalesce XML sync requests made within the same event loop tick
+        self._xml_dirty = False
+        self._xml_dirty_rows = None  # Set of changed rows, or None for the whole model
+        self._xml_flush_timer = QTimer(self)
+        self._xml_flush_timer.setSingleShot(True)
+        self._xml_flush_timer.setInterval(100)
+        self._xml_flush_timer.timeout.connect(self._flush_xml_sync)
+
+        # Redraw the keyboard once per burst of model changes, not once per row
+        self._keyboard_update_timer = QTimer(self)
+        self._keyboard_update_timer.setSingleShot(True)
+        self._keyboard_update_timer.setInterval(0)
+        self._keyboard_update_timer.timeout.connect(self.update_keyboard_display)
+
+        # Bumped whenever sample data that ends up in the XML may have changed
+        self._groups_revision = 0
+
         self.init_ui()
     
     def init_ui(self):
@@ -1268,7 +1513,8 @@ class SampleMappingWidget(QWidget):
         self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.table.setAlternatingRowColors(True)
         
-        # Set up model
+        # Set up model. The view talks to SampleGroupModel directly (no proxy
+        # model in between); sorting is implemented by SampleGroupModel.sort().
         self.model = SampleGroupModel(self.sample_groups)
         self.table.setModel(self.model)
         
@@ -1426,7 +1672,7 @@ class SampleMappingWidget(QWidget):
                 background-color: rgba(0, 0, 0, 0.2);
             }
         """)
-        self.sync_btn.clicked.connect(self.force_sync_xml)
+        self.sync_btn.clicked.connect(lambda: self.force_sync_xml())
         button_layout.addWidget(self.sync_btn)
         layout.addLayout(button_layout)
         
@@ -1446,6 +1692,10 @@ class SampleMappingWidget(QWidget):
         self.model.dataChanged.connect(self.on_data_changed)
         self.model.rowsInserted.connect(self.update_empty_table_message)
         self.model.rowsRemoved.connect(self.update_empty_table_message)
+        self.model.rowsInserted.connect(self.mark_groups_changed)
+        self.model.rowsRemoved.connect(self.mark_groups_changed)
+        self.model.modelReset.connect(self.mark_groups_changed)
+        self.model.layoutChanged.connect(self.mark_groups_changed)
         
         # Initial check for empty table
         self.update_empty_table_message()
@@ -1504,19 +1754,9 @@ class SampleMappingWidget(QWidget):
         if not file_paths:
             return
         
-        # Add samples to the list and auto-group by note
-        new_samples = []
-        for file_path in file_paths:
-            # Create a sample
-            sample = Sample(Path(file_path))
-            # Add to model (ungrouped initially)
-            self.model.samples.append(sample)
-            new_samples.append(sample)
-        
-        # Rebuild the model
-        self.model._build_sample_list()
-        self.model.beginResetModel()
-        self.model.endResetModel()
+        # Add samples to the model (ungrouped initially) as one block of rows
+        new_samples = [Sample(Path(file_path)) for file_path in file_paths]
+        self.model.append_samples(new_samples)
         
         # Update empty table message
         self.update_empty_table_message()
@@ -1559,13 +1799,10 @@ class SampleMappingWidget(QWidget):
     def auto_group_samples_by_note(self, samples: List[Sample]):
         """Auto-group samples by their root note."""
         # Group samples by root note
-        samples_by_note = {}
+        samples_by_note = defaultdict(list)
         for sample in samples:
             if hasattr(sample, 'root_note') and sample.root_note is not None:
-                note_name = self.get_note_name(sample.root_note)
-                if note_name not in samples_by_note:
-                    samples_by_note[note_name] = []
-                samples_by_note[note_name].append(sample)
+                samples_by_note[self.get_note_name(sample.root_note)].append(sample)
         
         # Create groups for each note
         for note_name, note_samples in samples_by_note.items():
@@ -1590,28 +1827,32 @@ class SampleMappingWidget(QWidget):
         self.model.endResetModel()
     
     def auto_map_new_samples_with_progress(self, new_samples: List[Sample]):
-        """Auto-map new samples with a progress dialog."""
+        """Auto-map new samples, with a progress dialog for larger imports."""
         if not new_samples:
             return
         
-        # Create progress dialog
-        progress = QProgressDialog("Auto-mapping new samples...", "Cancel", 0, len(new_samples), self)
-        progress.setWindowModality(Qt.WindowModal)
-        progress.setMinimumDuration(0)
-        progress.show()
+        # Small imports finish faster than the dialog can be shown, so only
+        # create a progress dialog when there is enough work to report on
+        progress = None
+        if len(new_samples) >= _PROGRESS_DIALOG_MIN_SAMPLES:
+            progress = QProgressDialog("Auto-mapping new samples...", "Cancel", 0, len(new_samples), self)
+            progress.setWindowModality(Qt.WindowModal)
+            progress.setMinimumDuration(0)
+            progress.show()
         
         mapped_count = 0
         for i, sample in enumerate(new_samples):
-            # Update progress dialog
-            progress.setValue(i)
-            progress.setLabelText(f"Mapping: {sample.file_path.name}")
-            
-            # Check if user cancelled
-            if progress.wasCanceled():
-                break
+            if progress is not None and i % _PROGRESS_UPDATE_INTERVAL == 0:
+                # Update progress dialog
+                progress.setValue(i)
+                progress.setLabelText(f"Mapping: {sample.file_name}")
+                
+                # Check if user cancelled
+                if progress.wasCanceled():
+                    break
             
             # Extract root note from filename
-            root_note = self.extract_root_note_from_filename(sample.file_path.name)
+            root_note = self.extract_root_note_from_filename(sample.file_name)
             if root_note is not None:
                 # Set Low/High notes to Root Note by default
                 sample.root_note = root_note
@@ -1625,13 +1866,18 @@ class SampleMappingWidget(QWidget):
         # Note: Auto-detection of round robin groups is now only available 
         # through the "Round Robin by Group" tab when user clicks "Auto-Detect"
         
-        # After all samples are mapped, ask user if they want to extend ranges
+        if progress is not None:
+            progress.setValue(len(new_samples))
+            progress.close()
+        
+        # Report the result in a single dialog: when samples were mapped, the
+        # counts go into the extend ranges question instead of a separate message
         if mapped_count > 0:
             try:
                 reply = QMessageBox.question(
                     self, 
-                    "Extend Sample Ranges", 
-                    f"Found {mapped_count} samples with root notes. Would you like to automatically extend their ranges to fill gaps between samples?\n\nThis will:\n- Fill gaps between the lowest and highest samples\n- Extend ranges intelligently to cover the sample range\n- Keep samples within their natural range",
+                    "Auto-Mapping Complete", 
+                    f"Successfully auto-mapped {mapped_count} out of {len(new_samples)} new samples based on filename patterns.\n\nWould you like to automatically extend their ranges to fill gaps between samples?\n\nThis will:\n- Fill gaps between the lowest and highest samples\n- Extend ranges intelligently to cover the sample range\n- Keep samples within their natural range",
                     QMessageBox.Yes | QMessageBox.No,
                     QMessageBox.Yes
                 )
@@ -1640,25 +1886,15 @@ class SampleMappingWidget(QWidget):
                     self.extend_sample_ranges_intelligently()
             except Exception as e:
                 print(f"Error showing extend ranges dialog: {e}")
-                # Skip the extend ranges dialog if there's an error
-        
-        progress.setValue(len(new_samples))
-        progress.close()
-        
-        # Show completion message
-        try:
-            if mapped_count > 0:
-                QMessageBox.information(self, "Auto-Mapping Complete", 
-                                      f"Successfully auto-mapped {mapped_count} out of {len(new_samples)} new samples based on filename patterns.")
-            else:
+                # Fallback to console output
+                print(f"Successfully auto-mapped {mapped_count} out of {len(new_samples)} new samples based on filename patterns.")
+        else:
+            try:
                 QMessageBox.information(self, "Auto-Mapping Complete", 
                                       "No new samples could be auto-mapped. Please set note ranges manually.")
-        except Exception as e:
-            print(f"Error showing completion message: {e}")
-            # Fallback to console output
-            if mapped_count > 0:
-                print(f"Successfully auto-mapped {mapped_count} out of {len(new_samples)} new samples based on filename patterns.")
-            else:
+            except Exception as e:
+                print(f"Error showing completion message: {e}")
+                # Fallback to console output
                 print("No new samples could be auto-mapped. Please set note ranges manually.")
     
     def extend_sample_ranges_intelligently(self):
@@ -1675,31 +1911,25 @@ class SampleMappingWidget(QWidget):
         # Sort by root note
         valid_samples.sort(key=lambda x: x.root_note)
         
-        # Group by root note to handle multiple samples on same note
+        # Group by root note to handle multiple samples on same note.
+        # Dicts keep insertion order, so the keys are already sorted.
         samples_by_note = {}
         for sample in valid_samples:
-            root_note = sample.root_note
-            if root_note not in samples_by_note:
-                samples_by_note[root_note] = []
-            samples_by_note[root_note].append(sample)
+            samples_by_note.setdefault(sample.root_note, []).append(sample)
         
-        # Get unique root notes sorted
-        unique_notes = sorted(samples_by_note.keys())
+        # Get unique root notes (already in ascending order)
+        unique_notes = list(samples_by_note)
         
         # Find the lowest and highest root notes
-        lowest_note = min(unique_notes)
-        highest_note = max(unique_notes)
+        lowest_note = unique_notes[0]
+        highest_note = unique_notes[-1]
         
         # Extend ranges to fill gaps only between lowest and highest samples
         for i, root_note in enumerate(unique_notes):
             samples_at_note = samples_by_note[root_note]
             
-            # Find the next different root note
-            next_note = None
-            for j in range(i + 1, len(unique_notes)):
-                if unique_notes[j] != root_note:
-                    next_note = unique_notes[j]
-                    break
+            # The next key is always the next different root note
+            next_note = unique_notes[i + 1] if i + 1 < len(unique_notes) else None
             
             # Calculate range for this root note
             if root_note == lowest_note:
@@ -1769,19 +1999,24 @@ class SampleMappingWidget(QWidget):
             return
         
         # Remove samples from their groups first
-        for sample in selected_samples:
-            self.model.remove_sample_from_group(sample)
-        
-        # Remove samples from the model
-        for sample in selected_samples:
-            if sample in self.model.samples:
-                self.model.samples.remove(sample)
-        
-        # Rebuild the model
-        self.model._build_sample_list()
-        self.model.beginResetModel()
-        self.model.endResetModel()
+        self.model.remove_samples_from_groups(selected_samples)
         
+        # Find the rows to remove in a single pass (identity set avoids O(N*K) list.remove)
+        selected_ids = set(id(sample) for sample in selected_samples)
+        rows_to_remove = [row for row, sample in enumerate(self.model.samples)
+                          if id(sample) in selected_ids]
+
+        # Remove contiguous runs of rows from the bottom up so the remaining row
+        # numbers stay valid, letting the view drop only those rows instead of a full reset
+        while rows_to_remove:
+            last = rows_to_remove.pop()
+            first = last
+            while rows_to_remove and rows_to_remove[-1] == first - 1:
+                first = rows_to_remove.pop()
+            self.model.beginRemoveRows(QModelIndex(), first, last)
+            del self.model.samples[first:last + 1]
+            self.model.endRemoveRows()
+
         # Update empty table message
         self.update_empty_table_message()
         
@@ -1798,7 +2033,7 @@ class SampleMappingWidget(QWidget):
     def auto_map_samples(self):
         """Auto-map samples based on filename patterns."""
         for i, sample in enumerate(self.model.samples):
-            root_note = self.extract_root_note_from_filename(sample.file_path.name)
+            root_note = self.extract_root_note_from_filename(sample.file_name)
             if root_note is not None:
                 # Set a reasonable range around the root note
                 low_note = max(0, root_note - 12)
@@ -1818,50 +2053,9 @@ class SampleMappingWidget(QWidget):
     
     def extract_root_note_from_filename(self, filename: str) -> Optional[int]:
         """Extract root note from filename using common patterns."""
-        # Remove file extension
-        name = Path(filename).stem.upper()
-        
-        # Pattern 1: Note + Octave (e.g., "C4", "A#3", "Bb2")
-        patterns = [
-            r'([A-G]#?b?)(\d+)',  # C4, A#3, Bb2
-            r'([A-G])(\d+)',      # C4, A3
-            r'([A-G]#?)(\d+)',    # C#4, A3
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, name)
-            if match:
-                note_name = match.group(1)
-                octave = int(match.group(2))
-                
-                # Convert note name to MIDI number
-                note_map = {
-                    'C': 0, 'C#': 1, 'DB': 1, 'D': 2, 'D#': 3, 'EB': 3,
-                    'E': 4, 'F': 5, 'F#': 6, 'GB': 6, 'G': 7, 'G#': 8,
-                    'AB': 8, 'A': 9, 'A#': 10, 'BB': 10, 'B': 11
-                }
-                
-                if note_name in note_map:
-                    midi_note = 12 + (octave * 12) + note_map[note_name]
-                    if 21 <= midi_note <= 108:  # Valid piano range
-                        return midi_note
-        
-        # Pattern 2: Kick, Snare, etc. with octave
-        drum_patterns = [
-            (r'KICK.*?C?(\d+)', 36),  # Kick_C1 -> C1 (36)
-            (r'SNARE.*?C?(\d+)', 38), # Snare_C2 -> C2 (38)
-            (r'HAT.*?C?(\d+)', 42),   # Hat_C3 -> C3 (42)
-        ]
-        
-        for pattern, base_note in drum_patterns:
-            match = re.search(pattern, name)
-            if match:
-                octave = int(match.group(1))
-                midi_note = 12 + (octave * 12) + (base_note % 12)
-                if 21 <= midi_note <= 108:
-                    return midi_note
-        
-        return None
+        # Libraries repeat the same names across layers/articulations, so the
+        # parse is cached on the plain filename string
+        return _extract_root_note(filename)
     
     def on_selection_changed(self):
         """Handle table selection changes."""
@@ -1894,7 +2088,18 @@ class SampleMappingWidget(QWidget):
     
     def on_data_changed(self, top_left, bottom_right, roles):
         """Handle model data changes."""
-        self.update_keyboard_display()
+        # Checkbox column only: the selection is not part of the XML
+        if top_left.column() != 0 or bottom_right.column() != 0:
+            self._groups_revision += 1
+        self._keyboard_update_timer.start()
+    
+    def mark_groups_changed(self, *args):
+        """Record that the sample groups changed outside of a model dataChanged."""
+        self._groups_revision += 1
+    
+    def get_sample_groups_signature(self) -> tuple:
+        """Get a cheap value that changes whenever get_sample_groups() may have changed."""
+        return (id(self.model), len(self.model.sample_groups), self._groups_revision)
     
     def play_sample(self, note_number):
         """Play the sample associated with the clicked key with pitch adjustment."""
@@ -1936,11 +2141,11 @@ class SampleMappingWidget(QWidget):
                 # This is a simplified approach - in a real implementation, you'd want proper pitch shifting
                 playback_rate = 2 ** (pitch_semitones / 12.0)  # Convert semitones to playback rate
                 self.media_player.setPlaybackRate(playback_rate)
-                self.show_status_message(f"Playing: {sample.file_path.name} (pitch adjusted by {pitch_semitones:+d} semitones)")
+                self.show_status_message(f"Playing: {sample.file_name} (pitch adjusted by {pitch_semitones:+d} semitones)")
             else:
                 # Reset to normal playback rate
                 self.media_player.setPlaybackRate(1.0)
-                self.show_status_message(f"Playing: {sample.file_path.name}")
+                self.show_status_message(f"Playing: {sample.file_name}")
             
             # Play the audio
             self.media_player.play()
@@ -1975,7 +2180,7 @@ class SampleMappingWidget(QWidget):
                 subprocess.Popen(['xdg-open', file_path])
                 
             # Show a brief status message
-            self.show_status_message(f"Playing: {sample.file_path.name}")
+            self.show_status_message(f"Playing: {sample.file_name}")
             
         except Exception as e:
             QMessageBox.warning(self, "Playback Error", 
@@ -1995,7 +2200,7 @@ class SampleMappingWidget(QWidget):
                 try:
                     pygame.mixer.music.load(str(sample.file_path.absolute()))
                     pygame.mixer.music.play()
-                    self.show_status_message(f"Playing: {sample.file_path.name}")
+                    self.show_status_message(f"Playing: {sample.file_name}")
                 except Exception as e:
                     print(f"Pygame playback error: {e}")
             
@@ -2064,15 +2269,56 @@ class SampleMappingWidget(QWidget):
         # this would show in a status bar or notification
         print(f"Status: {message}")
     
-    def force_sync_xml(self):
-        """Force sync with XML preview."""
+    def force_sync_xml(self, rows: Optional[Iterable[int]] = None):
+        """Force sync with XML preview.
+
+        Requests are coalesced: the model broadcast and XML update happen once
+        after a short delay, however many times this is called in between.
+        Pass ``rows`` to limit the broadcast to the rows that actually changed.
+        """
+        self._groups_revision += 1
+        rows = set(rows) if rows is not None else None
+        if not rows:
+            # Unknown (or empty) change set - broadcast the whole model
+            self._xml_dirty_rows = None
+        elif not self._xml_dirty:
+            self._xml_dirty_rows = rows
+        elif self._xml_dirty_rows is not None:
+            self._xml_dirty_rows |= rows
+
+        self._xml_dirty = True
+        self._xml_flush_timer.start()
+
+    def _flush_xml_sync(self):
+        """Emit the pending model broadcast and trigger the XML update."""
+        if not self._xml_dirty:
+            return
+        dirty_rows = self._xml_dirty_rows
+        self._xml_dirty = False
+        self._xml_dirty_rows = None
+
         # Emit a signal to trigger XML update
-        if self.model.rowCount() > 0:
-            self.model.dataChanged.emit(
-                self.model.createIndex(0, 0), 
-                self.model.createIndex(self.model.rowCount() - 1, self.model.columnCount() - 1), 
-                []
-            )
+        row_count = self.model.rowCount()
+        if row_count > 0:
+            if dirty_rows is None:
+                blocks = [(0, row_count - 1)]
+            else:
+                # One broadcast per contiguous block of changed rows
+                blocks = []
+                for row in sorted(dirty_rows):
+                    if row >= row_count:
+                        break
+                    if blocks and blocks[-1][1] == row - 1:
+                        blocks[-1] = (blocks[-1][0], row)
+                    else:
+                        blocks.append((row, row))
+            last_column = self.model.columnCount() - 1
+            for first, last in blocks:
+                self.model.dataChanged.emit(
+                    self.model.createIndex(first, 0),
+                    self.model.createIndex(last, last_column),
+                    []
+                )
         
         # Also trigger the main window's XML update if available
         if hasattr(self, 'main_window') and self.main_window:
@@ -2080,33 +2326,35 @@ class SampleMappingWidget(QWidget):
     
     def get_note_name(self, note_number):
         """Convert MIDI note number to note name."""
-        notes = ['C', 'C#', 'D', 'D#', 'E', 'F', 'F#', 'G', 'G#', 'A', 'A#', 'B']
-        octave = (note_number // 12) - 1
-        note = notes[note_number % 12]
-        return f"{note}{octave}"
+        return _note_name(note_number)
     
     def update_keyboard_display(self):
         """Update the keyboard display with current sample assignments."""
         assigned_samples = {}
         round_robin_samples = {}
+        get_group = self.model.sample_to_group.get
         
         for sample in self.model.samples:
             if hasattr(sample, 'low_note') and hasattr(sample, 'high_note'):
-                for note_num in range(sample.low_note, sample.high_note + 1):
-                    if 21 <= note_num <= 108:  # Valid piano range
-                        # Check if this is a round robin sample
-                        if hasattr(sample, 'seq_mode') and sample.seq_mode in ['random', 'true_random', 'round_robin']:
-                            round_robin_samples[note_num] = {
-                                'sample': sample,
-                                'seq_mode': sample.seq_mode,
-                                'seq_position': getattr(sample, 'seq_position', 1),
-                                'seq_length': getattr(sample, 'seq_length', 0)
-                            }
-                        else:
-                            # Find the group this sample belongs to
-                            group = self.model.sample_to_group.get(sample)
-                            if group:
-                                assigned_samples[note_num] = group
+                # Clamp the sample's range to the valid piano range (21-108) once,
+                # then assign the whole span in bulk instead of note by note
+                notes = range(max(sample.low_note, 21), min(sample.high_note, 108) + 1)
+                if not notes:
+                    continue
+
+                # Check if this is a round robin sample
+                if hasattr(sample, 'seq_mode') and sample.seq_mode in RR_MODES:
+                    round_robin_samples.update(dict.fromkeys(notes, {
+                        'sample': sample,
+                        'seq_mode': sample.seq_mode,
+                        'seq_position': getattr(sample, 'seq_position', 1),
+                        'seq_length': getattr(sample, 'seq_length', 0)
+                    }))
+                else:
+                    # Find the group this sample belongs to
+                    group = get_group(sample)
+                    if group:
+                        assigned_samples.update(dict.fromkeys(notes, group))
         
         self.visual_keyboard.set_assigned_samples(assigned_samples)
         self.visual_keyboard.set_round_robin_samples(round_robin_samples)
@@ -2115,11 +2363,9 @@ class SampleMappingWidget(QWidget):
         """Handle drag enter events."""
         if event.mimeData().hasUrls():
             # Check if any of the URLs are audio files
-            for url in event.mimeData().urls():
-                file_path = Path(url.toLocalFile())
-                if file_path.suffix.lower() in ['.wav', '.aif', '.aiff', '.flac', '.mp3']:
-                    event.acceptProposedAction()
-                    return
+            if self.get_dropped_audio_files(event.mimeData()):
+                event.acceptProposedAction()
+                return
         event.ignore()
     
     def dragMoveEvent(self, event):
@@ -2129,36 +2375,33 @@ class SampleMappingWidget(QWidget):
         else:
             event.ignore()
     
+    def get_dropped_audio_files(self, mime_data) -> List[Path]:
+        """Get the audio file paths from dropped URLs."""
+        audio_files = []
+        for url in mime_data.urls():
+            file_path = Path(url.toLocalFile())
+            if file_path.suffix.lower() in _AUDIO_SUFFIXES:
+                audio_files.append(file_path)
+        return audio_files
+    
     def dropEvent(self, event):
         """Handle drop events."""
         if event.mimeData().hasUrls():
             # Get audio files from the dropped URLs
-            audio_files = []
-            for url in event.mimeData().urls():
-                file_path = Path(url.toLocalFile())
-                if file_path.suffix.lower() in ['.wav', '.aif', '.aiff', '.flac', '.mp3']:
-                    audio_files.append(file_path)
+            audio_files = self.get_dropped_audio_files(event.mimeData())
             
             if audio_files:
-                # Add the files as samples
-                new_samples = []
-                for file_path in audio_files:
-                    # Create a sample
-                    sample = Sample(file_path)
-                    self.model.samples.append(sample)
-                    new_samples.append(sample)
-                
-                # Rebuild the model
-                self.model._build_sample_list()
-                self.model.beginResetModel()
-                self.model.endResetModel()
+                # Add the files as samples in one block of inserted rows
+                first_row = len(self.model.samples)
+                new_samples = [Sample(file_path) for file_path in audio_files]
+                self.model.append_samples(new_samples)
                 
                 # Update empty table message
                 self.update_empty_table_message()
                 
-                # Auto-map the new samples
-                if new_samples:
-                    self.auto_map_new_samples_with_progress(new_samples)
+                # Auto-map the new samples and refresh just their rows
+                self.auto_map_new_samples_with_progress(new_samples)
+                self.force_sync_xml(range(first_row, first_row + len(new_samples)))
                 
                 self.update_keyboard_display()
                 event.acceptProposedAction()
@@ -2197,14 +2440,15 @@ class SampleMappingWidget(QWidget):
             group.amp_vel_track = group_data['amp_vel_track']
             group.group_tuning = group_data['group_tuning']
             
-            # Add selected samples to the group
-            for sample in selected_samples:
-                self.model.add_sample_to_group(sample, group)
-            
-            # Clear selection
-            for sample in self.model.samples:
-                sample.selected = False
-            self.model.dataChanged.emit(self.model.createIndex(0, 0), self.model.createIndex(self.model.rowCount() - 1, self.model.columnCount() - 1), [])
+            with self.model.batch_update():
+                # Add selected samples to the group
+                for sample in selected_samples:
+                    self.model.add_sample_to_group(sample, group)
+                
+                # Clear selection
+                for sample in self.model.samples:
+                    sample.selected = False
+                self.model.emit_all_changed()
     
     def edit_group(self):
         """Edit the group of selected samples."""
@@ -2269,6 +2513,7 @@ class SampleMappingWidget(QWidget):
         self.model = SampleGroupModel(sample_groups)
         self.table.setModel(self.model)
         self.connect_signals()
+        self._groups_revision += 1
         
         # Auto-map samples with progress dialog
         if sample_groups:
@@ -2276,6 +2521,21 @@ class SampleMappingWidget(QWidget):
         
         self.update_keyboard_display()
     
+    def apply_root_notes(self, samples: List[Sample], root_notes: List[Optional[int]]) -> int:
+        """Set each sample's range to its root note +/- 12 notes; returns the mapped count."""
+        # Filter out the unmatched samples first, so the write-back loop only
+        # visits matches and needs no per-sample branch or counter
+        matched = [(sample, root_note) for sample, root_note in zip(samples, root_notes)
+                   if root_note is not None]
+        
+        # Extracted root notes are always within the piano range (21-108),
+        # so a range of +/- 12 notes never needs clamping to 0-127.
+        for sample, root_note in matched:
+            sample.root_note = root_note
+            sample.low_note = root_note - 12
+            sample.high_note = root_note + 12
+        return len(matched)
+    
     def auto_map_samples_with_progress(self):
         """Auto-map samples with a progress dialog."""
         if not self.model.samples:
@@ -2287,28 +2547,32 @@ class SampleMappingWidget(QWidget):
         progress.setMinimumDuration(0)
         progress.show()
         
+        samples = self.model.samples
+        names = [sample.file_name for sample in samples]
+        extract_root_note = self.extract_root_note_from_filename
+        
         mapped_count = 0
-        for i, sample in enumerate(self.model.samples):
-            # Update progress dialog
-            progress.setValue(i)
-            progress.setLabelText(f"Mapping: {sample.file_path.name}")
-            
-            # Check if user cancelled
-            if progress.wasCanceled():
-                break
-            
-            # Extract root note from filename
-            root_note = self.extract_root_note_from_filename(sample.file_path.name)
-            if root_note is not None:
-                # Set a reasonable range around the root note
-                low_note = max(0, root_note - 12)
-                high_note = min(127, root_note + 12)
+        # Reset the model once around the whole pass so attached views don't
+        # repaint rows while the progress dialog pumps events
+        self.model.beginResetModel()
+        try:
+            # Extract the root notes in blocks, updating the progress dialog per block
+            root_notes = []
+            for start in range(0, len(names), _PROGRESS_UPDATE_INTERVAL):
+                progress.setValue(start)
+                progress.setLabelText(f"Mapping: {names[start]}")
                 
-                # Update the sample
-                sample.root_note = root_note
-                sample.low_note = low_note
-                sample.high_note = high_note
-                mapped_count += 1
+                # Check if user cancelled
+                if progress.wasCanceled():
+                    break
+                
+                root_notes.extend([extract_root_note(name)
+                                   for name in names[start:start + _PROGRESS_UPDATE_INTERVAL]])
+            
+            # Write the mapped ranges back in a single pass
+            mapped_count = self.apply_root_notes(samples, root_notes)
+        finally:
+            self.model.endResetModel()
         
         progress.setValue(len(self.model.samples))
         progress.close()
@@ -2340,41 +2604,36 @@ class SampleMappingWidget(QWidget):
                 sample.seq_mode = settings['seq_mode']
                 sample.seq_length = settings['seq_length']
             
-            # Update the model
-            self.model.beginResetModel()
-            self.model.endResetModel()
-            
-            # Update keyboard display
-            self.update_keyboard_display()
-            
-            # Trigger XML update
-            if hasattr(self.parent(), 'update_xml_live'):
-                self.parent().update_xml_live()
+            # Update only the rows that were touched, instead of resetting the model.
+            # The broadcast is deferred and coalesced by force_sync_xml; it refreshes
+            # the keyboard display and schedules the XML update once edits settle.
+            rows = {row for row in map(self.model.get_sample_row, settings['samples'])
+                    if row >= 0}
+            if rows:
+                self.force_sync_xml(rows)
     
     def detect_round_robin_pattern(self, sample: Sample):
         """Detect round robin patterns in filename and set appropriate attributes."""
-        filename = sample.file_path.stem.lower()  # Get filename without extension
-        
-        # Common round robin patterns
-        patterns = [
-            r'_rr(\d+)$',      # _rr1, _rr2, etc.
-            r'_(\d+)$',        # _1, _2, etc.
-            r'_round(\d+)$',   # _round1, _round2, etc.
-            r'_alt(\d+)$',     # _alt1, _alt2, etc.
-            r'_var(\d+)$',     # _var1, _var2, etc.
-        ]
+        filename = sample.file_stem_lower  # Get filename without extension
         
-        for pattern in patterns:
-            match = re.search(pattern, filename)
-            if match:
-                try:
-                    position = int(match.group(1))
-                    sample.seq_mode = "round_robin"
-                    sample.seq_position = position
-                    # Don't set seq_length here - let the user configure it
-                    break
-                except ValueError:
-                    continue
+        # Cheap string pre-filter: a round robin suffix is always the text after
+        # the last underscore, an optional rr/round/alt/var prefix plus digits.
+        # Most non round robin names are rejected here without running the regex.
+        _, separator, tail = filename.rpartition('_')
+        if not separator or not tail[-1:].isdecimal():
+            return
+        if tail.isascii() and tail.rstrip('0123456789') not in _RR_PREFIXES:
+            return
+        
+        match = _RR_COMBINED.search(filename)
+        if match:
+            try:
+                position = int(match.group(1))
+            except ValueError:
+                return
+            sample.seq_mode = MODE_ROUND_ROBIN
+            sample.seq_position = position
+            # Don't set seq_length here - let the user configure it
 
 
 class RoundRobinDialog(QDialog):
@@ -2385,6 +2644,7 @@ class RoundRobinDialog(QDialog):
         self.samples = samples or []
         self.sample_mapping = sample_mapping
         self.selected_samples = self.samples.copy()  # Start with provided samples
+        self._selected_ids = set(id(sample) for sample in self.selected_samples)  # Fast membership tests
         self.setWindowTitle("Configure Round Robin")
         self.setModal(True)
         self.resize(800, 600)
@@ -2392,8 +2652,18 @@ class RoundRobinDialog(QDialog):
         self.setup_ui()
         self.load_existing_settings()
     
+    @staticmethod
+    def configure_sample_list(list_widget: QListWidget):
+        """Let Qt lay out a sample list without measuring every item."""
+        # Every item is a single line of text, so one size hint fits all rows
+        list_widget.setViewMode(QListView.ListMode)
+        list_widget.setUniformItemSizes(True)
+        list_widget.setLayoutMode(QListView.Batched)
+        list_widget.setBatchSize(100)
+
     def setup_ui(self):
         """Set up the dialog UI."""
+        install_round_robin_stylesheet()  # Button styles are shared app-wide
         layout = QVBoxLayout()
         
         # Create main layout
@@ -2433,10 +2703,10 @@ class RoundRobinDialog(QDialog):
         self.true_random_radio = QRadioButton("True Random - Completely random selection")
         self.round_robin_radio = QRadioButton("Round Robin - Sequential selection")
         
-        self.mode_buttons.addButton(self.always_radio, 0)
-        self.mode_buttons.addButton(self.random_radio, 1)
-        self.mode_buttons.addButton(self.true_random_radio, 2)
-        self.mode_buttons.addButton(self.round_robin_radio, 3)
+        self.mode_buttons.addButton(self.always_radio, _MODE_TO_ID[MODE_ALWAYS])
+        self.mode_buttons.addButton(self.random_radio, _MODE_TO_ID[MODE_RANDOM])
+        self.mode_buttons.addButton(self.true_random_radio, _MODE_TO_ID[MODE_TRUE_RANDOM])
+        self.mode_buttons.addButton(self.round_robin_radio, _MODE_TO_ID[MODE_ROUND_ROBIN])
         
         self.always_radio.setChecked(True)
         
@@ -2457,57 +2727,18 @@ class RoundRobinDialog(QDialog):
         # Sample list
         self.available_samples_list = QListWidget()
         self.available_samples_list.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.configure_sample_list(self.available_samples_list)
         available_layout.addWidget(self.available_samples_list)
         
         # Add/Remove buttons
         sample_buttons_layout = QHBoxLayout()
         self.add_sample_btn = QPushButton("➕ Add Selected")
+        self.add_sample_btn.setObjectName("rrAddSampleBtn")  # Styled by ROUND_ROBIN_STYLESHEET
         self.add_sample_btn.clicked.connect(self.add_selected_samples)
-        self.add_sample_btn.setStyleSheet("""
-            QPushButton {
-                border-radius: 15px;
-                padding: 8px 16px;
-                font-weight: bold;
-                background-color: #e8f5e8;
-                border: 2px solid #4caf50;
-                color: #000000;
-            }
-            QPushButton:hover {
-                background-color: #c8e6c9;
-                color: #ffffff;
-                border: 3px solid #388e3c;
-                font-size: 13px;
-            }
-            QPushButton:pressed {
-                background-color: #a5d6a7;
-                color: #ffffff;
-                border: 3px solid #2e7d32;
-            }
-        """)
         
         self.remove_sample_btn = QPushButton("➖ Remove Selected")
+        self.remove_sample_btn.setObjectName("rrRemoveSampleBtn")  # Styled by ROUND_ROBIN_STYLESHEET
         self.remove_sample_btn.clicked.connect(self.remove_selected_samples)
-        self.remove_sample_btn.setStyleSheet("""
-            QPushButton {
-                border-radius: 15px;
-                padding: 8px 16px;
-                font-weight: bold;
-                background-color: #ffebee;
-                border: 2px solid #f44336;
-                color: #000000;
-            }
-            QPushButton:hover {
-                background-color: #ffcdd2;
-                color: #ffffff;
-                border: 3px solid #d32f2f;
-                font-size: 13px;
-            }
-            QPushButton:pressed {
-                background-color: #ef9a9a;
-                color: #ffffff;
-                border: 3px solid #c62828;
-            }
-        """)
         
         sample_buttons_layout.addWidget(self.add_sample_btn)
         sample_buttons_layout.addWidget(self.remove_sample_btn)
@@ -2524,6 +2755,7 @@ class RoundRobinDialog(QDialog):
         # Selected samples list
         self.selected_samples_list = QListWidget()
         self.selected_samples_list.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.configure_sample_list(self.selected_samples_list)
         selected_layout.addWidget(self.selected_samples_list)
         
         # Position controls for selected samples
@@ -2569,9 +2801,26 @@ class RoundRobinDialog(QDialog):
     def showEvent(self, event):
         """Refresh available samples when dialog is shown."""
         super().showEvent(event)
-        self.load_available_samples()
+        self.update_available_samples_list()
         self.update_selected_samples_list()
     
+    def create_available_item(self, sample: Sample) -> QListWidgetItem:
+        """Create an available samples list item for a sample."""
+        item = QListWidgetItem(_sample_display_text(sample.file_name, sample.root_note))
+        item.setData(Qt.UserRole, sample)
+        return item
+    
+    def selected_item_text(self, sample: Sample, position: int) -> str:
+        """Get the selected samples list text for a sample at a round robin position."""
+        # Reuse the cached label, adding the position before its closing parenthesis
+        return f"{_sample_display_text(sample.file_name, sample.root_note)[:-1]}, Pos: {position})"
+    
+    def create_selected_item(self, sample: Sample, position: int) -> QListWidgetItem:
+        """Create a selected samples list item for a sample at a round robin position."""
+        item = QListWidgetItem(self.selected_item_text(sample, position))
+        item.setData(Qt.UserRole, sample)
+        return item
+    
     def load_available_samples(self):
         """Load all available samples from the sample mapping."""
         self.available_samples_list.clear()
@@ -2582,10 +2831,7 @@ class RoundRobinDialog(QDialog):
             for sample in samples:
                 if sample:
                     # Create item with sample info
-                    item_text = f"{sample.file_path.name} (Note: {sample.root_note})"
-                    item = QListWidgetItem(item_text)
-                    item.setData(Qt.UserRole, sample)
-                    self.available_samples_list.addItem(item)
+                    self.available_samples_list.addItem(self.create_available_item(sample))
     
     def add_selected_samples(self):
         """Add selected samples from available list to round robin group."""
@@ -2594,13 +2840,22 @@ class RoundRobinDialog(QDialog):
             QMessageBox.information(self, "No Selection", "Please select samples to add.")
             return
         
-        for item in selected_items:
-            sample = item.data(Qt.UserRole)
-            if sample not in self.selected_samples:
-                self.selected_samples.append(sample)
-        
-        self.update_selected_samples_list()
-        self.update_available_samples_list()
+        # Move only the affected items between the lists instead of rebuilding both
+        self.available_samples_list.setUpdatesEnabled(False)
+        self.selected_samples_list.setUpdatesEnabled(False)
+        try:
+            for item in selected_items:
+                sample = item.data(Qt.UserRole)
+                sample_id = id(sample)
+                if sample_id not in self._selected_ids:
+                    self._selected_ids.add(sample_id)
+                    self.selected_samples.append(sample)
+                    self.selected_samples_list.addItem(
+                        self.create_selected_item(sample, len(self.selected_samples)))
+                self.available_samples_list.takeItem(self.available_samples_list.row(item))
+        finally:
+            self.available_samples_list.setUpdatesEnabled(True)
+            self.selected_samples_list.setUpdatesEnabled(True)
     
     def remove_selected_samples(self):
         """Remove selected samples from round robin group."""
@@ -2609,37 +2864,61 @@ class RoundRobinDialog(QDialog):
             QMessageBox.information(self, "No Selection", "Please select samples to remove.")
             return
         
-        for item in selected_items:
-            sample = item.data(Qt.UserRole)
-            if sample in self.selected_samples:
-                self.selected_samples.remove(sample)
+        removed_ids = set(id(item.data(Qt.UserRole)) for item in selected_items)
+        removed_samples = [sample for sample in self.selected_samples if id(sample) in removed_ids]
+        self.selected_samples = [sample for sample in self.selected_samples
+                                 if id(sample) not in removed_ids]
+        self._selected_ids -= removed_ids
         
-        self.update_selected_samples_list()
-        self.update_available_samples_list()
+        self.available_samples_list.setUpdatesEnabled(False)
+        self.selected_samples_list.setUpdatesEnabled(False)
+        try:
+            # Drop the removed rows and renumber the positions of the rows that remain
+            rows = sorted(self.selected_samples_list.row(item) for item in selected_items)
+            for row in reversed(rows):
+                self.selected_samples_list.takeItem(row)
+            for row in range(rows[0], self.selected_samples_list.count()):
+                item = self.selected_samples_list.item(row)
+                item.setText(self.selected_item_text(item.data(Qt.UserRole), row + 1))
+            
+            # Put the removed samples back into the available list in model order
+            if self.sample_mapping and hasattr(self.sample_mapping, 'model'):
+                order = {id(sample): i for i, sample in enumerate(self.sample_mapping.model.samples)}
+                available = self.available_samples_list
+                keys = [order.get(id(available.item(row).data(Qt.UserRole)), -1)
+                        for row in range(available.count())]
+                for sample in sorted(removed_samples, key=lambda s: order.get(id(s), -1)):
+                    key = order.get(id(sample))
+                    if key is None:
+                        continue
+                    row = bisect_right(keys, key)
+                    keys.insert(row, key)
+                    available.insertItem(row, self.create_available_item(sample))
+        finally:
+            self.available_samples_list.setUpdatesEnabled(True)
+            self.selected_samples_list.setUpdatesEnabled(True)
     
     def update_selected_samples_list(self):
         """Update the selected samples list display."""
+        self.selected_samples_list.setUpdatesEnabled(False)
         self.selected_samples_list.clear()
         
         for i, sample in enumerate(self.selected_samples):
-            item_text = f"{sample.file_path.name} (Note: {sample.root_note}, Pos: {i+1})"
-            item = QListWidgetItem(item_text)
-            item.setData(Qt.UserRole, sample)
-            self.selected_samples_list.addItem(item)
+            self.selected_samples_list.addItem(self.create_selected_item(sample, i + 1))
+        self.selected_samples_list.setUpdatesEnabled(True)
     
     def update_available_samples_list(self):
         """Update the available samples list to exclude already selected ones."""
+        self.available_samples_list.setUpdatesEnabled(False)
         self.available_samples_list.clear()
         
         if self.sample_mapping and hasattr(self.sample_mapping, 'model'):
             # Get all samples directly from the model's samples list
             for sample in self.sample_mapping.model.samples:
-                if sample and sample not in self.selected_samples:
+                if sample and id(sample) not in self._selected_ids:
                     # Create item with sample info
-                    item_text = f"{sample.file_path.name} (Note: {sample.root_note})"
-                    item = QListWidgetItem(item_text)
-                    item.setData(Qt.UserRole, sample)
-                    self.available_samples_list.addItem(item)
+                    self.available_samples_list.addItem(self.create_available_item(sample))
+        self.available_samples_list.setUpdatesEnabled(True)
     
     def load_existing_settings(self):
         """Load existing round robin settings from samples."""
@@ -2648,13 +2927,13 @@ class RoundRobinDialog(QDialog):
         
         # Add existing samples to selected_samples
         self.selected_samples = self.samples.copy()
+        self._selected_ids = set(id(sample) for sample in self.selected_samples)
         
         # Check if samples already have round robin settings
         first_sample = self.samples[0]
-        if hasattr(first_sample, 'seq_mode') and first_sample.seq_mode != "always":
-            mode_map = {"always": 0, "random": 1, "true_random": 2, "round_robin": 3}
-            if first_sample.seq_mode in mode_map:
-                self.mode_buttons.button(mode_map[first_sample.seq_mode]).setChecked(True)
+        if hasattr(first_sample, 'seq_mode') and first_sample.seq_mode != MODE_ALWAYS:
+            if first_sample.seq_mode in _MODE_TO_ID:
+                self.mode_buttons.button(_MODE_TO_ID[first_sample.seq_mode]).setChecked(True)
         
         if hasattr(first_sample, 'seq_length'):
             self.length_spin.setValue(first_sample.seq_length)
@@ -2686,8 +2965,7 @@ class RoundRobinDialog(QDialog):
     def get_settings(self):
         """Get the configured round robin settings."""
         # Get mode
-        mode_map = {0: "always", 1: "random", 2: "true_random", 3: "round_robin"}
-        seq_mode = mode_map[self.mode_buttons.checkedId()]
+        seq_mode = _ID_TO_MODE[self.mode_buttons.checkedId()]
         
         # Get sequence length
         seq_length = self.length_spin.value()
@@ -2706,7 +2984,7 @@ class RoundRobinDialog(QDialog):
             # Generate default name from first sample
             if self.selected_samples:
                 first_sample = self.selected_samples[0]
-                group_name = f"RR_{first_sample.file_path.stem}"
+                group_name = f"RR_{first_sample.file_stem}"
             else:
                 group_name = "RR_Group"
         
@@ -2744,6 +3022,7 @@ class MultiGroupEditDialog(QDialog):
         layout.addWidget(groups_label)
         
         groups_list = QListWidget()
+        groups_list.setUniformItemSizes(True)  # Plain text rows, skip per-item size hints
         groups_list.addItems(self.group_names)
         groups_list.setMaximumHeight(80)
         groups_list.setEnabled(False)  # Read-only
@@ -2754,8 +3033,8 @@ class MultiGroupEditDialog(QDialog):
         mode_layout = QVBoxLayout()
         
         self.mode_combo = QComboBox()
-        self.mode_combo.addItems(["always", "round_robin", "random", "true_random"])
-        self.mode_combo.setCurrentText("round_robin")
+        self.mode_combo.addItems([MODE_ALWAYS, MODE_ROUND_ROBIN, MODE_RANDOM, MODE_TRUE_RANDOM])
+        self.mode_combo.setCurrentText(MODE_ROUND_ROBIN)
         mode_layout.addWidget(self.mode_combo)
         
         mode_group.setLayout(mode_layout)
@@ -2792,7 +3071,7 @@ class MultiGroupEditDialog(QDialog):
     def get_settings(self):
         """Get the current settings."""
         return {
-            'seq_mode': self.mode_combo.currentText(),
+            'seq_mode': sys.intern(self.mode_combo.currentText()),
             'seq_length': self.length_edit.value()
         }
 
@@ -2804,38 +3083,25 @@ class RoundRobinManager(QWidget):
         super().__init__(parent)
         self.round_robin_groups = {}  # Dict mapping group names to sample lists
         self.sample_mapping = parent
+        # Resolved once; None when the parent has no XML sync (e.g. standalone use)
+        self._force_sync_xml = getattr(parent, 'force_sync_xml', None)
+        self._tree_dirty = False  # Groups changed while the tree was hidden
+        self._tree_items = {}  # Group name -> (tree item, children key)
         self.setup_ui()
     
     def setup_ui(self):
         """Set up the round robin manager UI."""
+        install_round_robin_stylesheet()  # Button styles are shared app-wide
         layout = QVBoxLayout()
         
         # Header
         header_layout = QHBoxLayout()
         header_layout.addWidget(QLabel("Round Robin Groups"))
         self.add_group_btn = QPushButton("➕ Add Group")
+        self.add_group_btn.setObjectName("rrAddGroupBtn")  # Styled by ROUND_ROBIN_STYLESHEET
         self.add_group_btn.clicked.connect(self.add_group)
         self.add_group_btn.setMinimumHeight(35)  # Make button shorter
         self.add_group_btn.setMinimumWidth(200)  # Make button wider
-        self.add_group_btn.setStyleSheet("""
-            QPushButton {
-                font-size: 14px;
-                font-weight: bold;
-                padding: 8px 20px;
-                border-radius: 6px;
-                background-color: #e3f2fd;
-                border: 2px solid #2196f3;
-                color: #000000;
-            }
-            QPushButton:hover {
-                background-color: #bbdefb;
-                border: 3px solid #1976d2;
-            }
-            QPushButton:pressed {
-                background-color: #90caf9;
-                border: 3px solid #1565c0;
-            }
-        """)
         header_layout.addWidget(self.add_group_btn)
         layout.addLayout(header_layout)
         
@@ -2843,6 +3109,7 @@ class RoundRobinManager(QWidget):
         self.groups_tree = QTreeWidget()
         self.groups_tree.setHeaderLabels(["Group Name", "Mode", "Samples", "Length", "Details"])
         self.groups_tree.setAlternatingRowColors(True)
+        self.groups_tree.setUniformRowHeights(True)  # All rows are single-line text
         self.groups_tree.setSelectionMode(QAbstractItemView.ExtendedSelection)
         layout.addWidget(self.groups_tree)
         
@@ -2860,8 +3127,11 @@ class RoundRobinManager(QWidget):
         self.auto_detect_btn.clicked.connect(self.auto_detect_groups)
         self.select_all_btn.clicked.connect(self.select_all_groups)
         
-        # Initialize preview thread reference
-        self.current_preview_thread = None
+        # Preview playback runs on the GUI thread, one timer step per sample
+        self._preview_state = None
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.timeout.connect(self._preview_step)
         
         controls_layout.addWidget(self.select_all_btn)
         controls_layout.addWidget(self.edit_group_btn)
@@ -2899,16 +3169,19 @@ class RoundRobinManager(QWidget):
     def refresh_xml(self):
         """Refresh the XML preview."""
         if hasattr(self, 'main_window') and self.main_window:
+            self.sample_mapping.mark_groups_changed()
             self.main_window.schedule_xml_update()
     
     def add_group(self):
         """Add a new round robin group."""
-        if not hasattr(self.sample_mapping, 'model'):
+        model = getattr(self.sample_mapping, 'model', None)
+        if model is None:
             QMessageBox.warning(self, "No Samples", "No samples available to create a group.")
             return
+        sample_to_group = getattr(model, 'sample_to_group', None)
         
         # Check if there are any samples available
-        sample_count = self.sample_mapping.model.rowCount()
+        sample_count = model.rowCount()
         if sample_count == 0:
             QMessageBox.warning(self, "No Samples", "No samples available to create a group.")
             return
@@ -2928,12 +3201,9 @@ class RoundRobinManager(QWidget):
             existing_group = None
             
             # Check if all samples belong to the same group
-            if hasattr(self.sample_mapping, 'model') and hasattr(self.sample_mapping.model, 'sample_to_group'):
-                groups = set()
-                for sample in settings['samples']:
-                    group = self.sample_mapping.model.sample_to_group.get(sample)
-                    if group:
-                        groups.add(group)
+            if sample_to_group is not None:
+                groups = set(map(sample_to_group.get, settings['samples']))
+                groups.discard(None)
                 
                 # If all samples are in the same group, use that group
                 if len(groups) == 1:
@@ -2950,14 +3220,16 @@ class RoundRobinManager(QWidget):
                 self.round_robin_groups[group_name] = {
                     'samples': settings['samples'],
                     'seq_mode': settings['seq_mode'],
-                    'seq_length': settings['seq_length']
+                    'seq_length': settings['seq_length'],
+                    'model_group': existing_group
                 }
             else:
                 # Use group name from dialog
                 group_name = settings['group_name']
+                new_group = None
                 
                 # Create a new SampleGroup in the model
-                if hasattr(self.sample_mapping, 'model'):
+                if model is not None:
                     new_group = SampleGroup(
                         name=group_name,
                         enabled=True,
@@ -2968,44 +3240,51 @@ class RoundRobinManager(QWidget):
                     )
                     
                     # Add the group to the model
-                    self.sample_mapping.model.add_sample_group(new_group)
+                    model.add_sample_group(new_group)
                     
-                    # Move samples to the new group
-                    for sample in settings['samples']:
-                        self.sample_mapping.model.add_sample_to_group(sample, new_group)
+                    # Move samples to the new group, coalescing the full-model
+                    # dataChanged each move would broadcast into one
+                    with model.batch_update():
+                        for sample in settings['samples']:
+                            model.add_sample_to_group(sample, new_group)
                 
                 # Store in round robin groups for tracking
                 self.round_robin_groups[group_name] = {
                     'samples': settings['samples'],
                     'seq_mode': settings['seq_mode'],
-                    'seq_length': settings['seq_length']
+                    'seq_length': settings['seq_length'],
+                    'model_group': new_group
                 }
             
             # Reset individual sample round robin settings since they're handled at group level
             for sample in settings['samples']:
-                sample.seq_mode = "always"  # Reset to default since group handles round robin
+                sample.seq_mode = MODE_ALWAYS  # Reset to default since group handles round robin
                 sample.seq_length = 0       # Reset to default since group handles round robin
                 # seq_position is still set for ordering within the group
             
             # Update the tree
-            self.update_groups_tree()
+            self.mark_tree_dirty()
             
-            # Trigger XML update
-            if hasattr(self, 'main_window') and self.main_window:
+            # Trigger a deferred model broadcast and XML update, coalescing
+            # repeated edits into one regeneration
+            if self._force_sync_xml is not None:
+                self._force_sync_xml()
+            elif hasattr(self, 'main_window') and self.main_window:
                 self.main_window.schedule_xml_update()
     
     def clear_groups(self):
         """Clear all round robin groups when there are no samples."""
         self.round_robin_groups.clear()
-        self.update_groups_tree()
+        self.mark_tree_dirty()
         
         # Reset all samples' group associations
-        if hasattr(self.sample_mapping, 'model') and hasattr(self.sample_mapping.model, 'sample_to_group'):
-            self.sample_mapping.model.sample_to_group.clear()
+        sample_to_group = getattr(getattr(self.sample_mapping, 'model', None), 'sample_to_group', None)
+        if sample_to_group is not None:
+            sample_to_group.clear()
         
         # Trigger XML update
-        if hasattr(self.sample_mapping, 'force_sync_xml'):
-            self.sample_mapping.force_sync_xml()
+        if self._force_sync_xml is not None:
+            self._force_sync_xml()
     
     def edit_group(self):
         """Edit the selected round robin group(s)."""
@@ -3039,45 +3318,63 @@ class RoundRobinManager(QWidget):
                     # Remove old group and create new one
                     if group_name in self.round_robin_groups:
                         del self.round_robin_groups[group_name]
-                    
-                    # Update group name in the model if it exists
-                    if hasattr(self.sample_mapping, 'model') and hasattr(self.sample_mapping.model, 'sample_to_group'):
-                        for sample in settings['samples']:
-                            group = self.sample_mapping.model.sample_to_group.get(sample)
-                            if group and group.name == group_name:
-                                group.name = new_group_name
-                                group.seq_mode = settings['seq_mode']
-                                group.seq_length = settings['seq_length']
-                                break
+                
+                # Update the actual group in the model if it exists
+                group = self.get_model_group(group_name, group_data, settings['samples'])
+                if group:
+                    group.name = new_group_name
+                    group.seq_mode = settings['seq_mode']
+                    group.seq_length = settings['seq_length']
                 
                 # Update the group
                 self.round_robin_groups[new_group_name] = {
                     'samples': settings['samples'],
                     'seq_mode': settings['seq_mode'],
-                    'seq_length': settings['seq_length']
+                    'seq_length': settings['seq_length'],
+                    'model_group': group
                 }
                 
-                # Also update the actual group in the model if it exists (for unchanged name)
-                if new_group_name == group_name and hasattr(self.sample_mapping, 'model') and hasattr(self.sample_mapping.model, 'sample_to_group'):
-                    for sample in settings['samples']:
-                        group = self.sample_mapping.model.sample_to_group.get(sample)
-                        if group and group.name == group_name:
-                            group.seq_mode = settings['seq_mode']
-                            group.seq_length = settings['seq_length']
-                            break
-                
                 # Reset individual sample round robin settings since they're handled at group level
                 for sample in settings['samples']:
-                    sample.seq_mode = "always"  # Reset to default since group handles round robin
+                    sample.seq_mode = MODE_ALWAYS  # Reset to default since group handles round robin
                     sample.seq_length = 0       # Reset to default since group handles round robin
                     # seq_position is still set for ordering within the group
                 
                 # Update the tree
-                self.update_groups_tree()
+                self.mark_tree_dirty()
                 
                 # Trigger XML update
-                if hasattr(self.sample_mapping, 'force_sync_xml'):
-                    self.sample_mapping.force_sync_xml()
+                if self._force_sync_xml is not None:
+                    self._force_sync_xml()
+    
+    def get_model_group(self, group_name, group_data, samples=None):
+        """Get the model's SampleGroup backing a round robin group, or None.
+
+        Uses the reference stored under 'model_group' when it still has that name
+        and is still in the model, and otherwise searches ``samples`` (default: the
+        group's samples), caching the result.
+        """
+        group = group_data.get('model_group')
+        model_groups = getattr(getattr(self.sample_mapping, 'model', None), 'sample_groups', None)
+        if group is not None and group.name == group_name and model_groups and group in model_groups:
+            return group
+        
+        group = self.find_model_group(group_name, group_data['samples'] if samples is None else samples)
+        group_data['model_group'] = group
+        return group
+    
+    def find_model_group(self, group_name, samples):
+        """Find the model's SampleGroup named group_name that holds any of samples."""
+        sample_to_group = getattr(getattr(self.sample_mapping, 'model', None), 'sample_to_group', None)
+        if not sample_to_group or not samples:
+            return None
+        
+        # The group's own samples are normally listed first, so this is usually one lookup
+        group = sample_to_group.get(samples[0])
+        if group and group.name == group_name:
+            return group
+        return next((group for group in map(sample_to_group.get, samples)
+                     if group and group.name == group_name), None)
     
     def edit_multiple_groups(self, items):
         """Edit multiple round robin groups - only mode and length."""
@@ -3090,23 +3387,22 @@ class RoundRobinManager(QWidget):
             
             # Update all selected groups
             for group_name in group_names:
-                if group_name in self.round_robin_groups:
-                    self.round_robin_groups[group_name]['seq_mode'] = settings['seq_mode']
-                    self.round_robin_groups[group_name]['seq_length'] = settings['seq_length']
+                group_data = self.round_robin_groups.get(group_name)
+                if group_data is not None:
+                    group_data['seq_mode'] = settings['seq_mode']
+                    group_data['seq_length'] = settings['seq_length']
                     
                     # Also update the actual group in the model if it exists
-                    if hasattr(self.sample_mapping, 'model') and hasattr(self.sample_mapping.model, 'sample_to_group'):
-                        for sample in self.round_robin_groups[group_name]['samples']:
-                            group = self.sample_mapping.model.sample_to_group.get(sample)
-                            if group and group.name == group_name:
-                                group.seq_mode = settings['seq_mode']
-                                group.seq_length = settings['seq_length']
-                                break
+                    group = self.get_model_group(group_name, group_data)
+                    if group:
+                        group.seq_mode = settings['seq_mode']
+                        group.seq_length = settings['seq_length']
             
-            self.update_groups_tree()
+            self.mark_tree_dirty()
             
             # Trigger XML update
             if hasattr(self, 'main_window') and self.main_window:
+                self.sample_mapping.mark_groups_changed()
                 self.main_window.schedule_xml_update()
     
     def remove_group(self):
@@ -3130,16 +3426,16 @@ class RoundRobinManager(QWidget):
                 # Reset round robin settings for samples in this group
                 group_data = self.round_robin_groups[group_name]
                 for sample in group_data['samples']:
-                    sample.seq_mode = "always"
+                    sample.seq_mode = MODE_ALWAYS
                     sample.seq_length = 0
                     sample.seq_position = 1
                 
                 del self.round_robin_groups[group_name]
-                self.update_groups_tree()
+                self.mark_tree_dirty()
                 
                 # Trigger XML update
-                if hasattr(self.sample_mapping, 'force_sync_xml'):
-                    self.sample_mapping.force_sync_xml()
+                if self._force_sync_xml is not None:
+                    self._force_sync_xml()
     
     def preview_group(self):
         """Preview the selected round robin group by cycling through all samples."""
@@ -3165,71 +3461,61 @@ class RoundRobinManager(QWidget):
         if not samples:
             return
         
-        # Create a preview thread to cycle through samples
-        from PySide6.QtCore import QThread, QTimer
-        import time
-        
-        class RoundRobinPreviewThread(QThread):
-            def __init__(self, samples, seq_mode, play_callback):
-                super().__init__()
-                self.samples = samples
-                self.seq_mode = seq_mode
-                self.play_callback = play_callback
-                self.running = True
-                self.current_index = 0
-            
-            def run(self):
-                if self.seq_mode == "round_robin":
-                    # Sequential round robin - play each sample in order
-                    for i, sample in enumerate(self.samples):
-                        if not self.running:
-                            break
-                        self.play_callback(sample)
-                        if i < len(self.samples) - 1:  # Don't wait after the last sample
-                            self.msleep(2000)  # Wait 2 seconds between samples
-                elif self.seq_mode == "random":
-                    # Random selection - play 5 random samples
-                    import random
-                    for _ in range(min(5, len(self.samples) * 2)):  # Play up to 5 samples
-                        if not self.running:
-                            break
-                        sample = random.choice(self.samples)
-                        self.play_callback(sample)
-                        self.msleep(2000)  # Wait 2 seconds between samples
-                elif self.seq_mode == "true_random":
-                    # True random - play 5 random samples with random timing
-                    import random
-                    for _ in range(min(5, len(self.samples) * 2)):  # Play up to 5 samples
-                        if not self.running:
-                            break
-                        sample = random.choice(self.samples)
-                        self.play_callback(sample)
-                        # Random delay between 1-3 seconds
-                        self.msleep(random.randint(1000, 3000))
-                else:  # "always" mode - just play the first sample
-                    self.play_callback(self.samples[0])
-            
-            def stop(self):
-                self.running = False
-        
-        # Start the preview thread
-        self.preview_thread = RoundRobinPreviewThread(samples, seq_mode, self.sample_mapping.play_sample_file)
-        self.preview_thread.start()
-        
-        # Store reference so we can stop it if needed
-        self.current_preview_thread = self.preview_thread
+        if seq_mode in (MODE_RANDOM, MODE_TRUE_RANDOM):
+            # Random modes play up to 5 randomly chosen samples
+            remaining = min(5, len(samples) * 2)
+        elif seq_mode == MODE_ROUND_ROBIN:
+            # Sequential round robin - play each sample in order
+            remaining = len(samples)
+        else:  # "always" mode - just play the first sample
+            remaining = 1
+        
+        self._preview_state = {
+            'samples': samples,
+            'mode': seq_mode,
+            'index': 0,
+            'remaining': remaining,
+            'play': self.sample_mapping.play_sample_file
+        }
+        self._preview_step()
         
         # Update button text to show it's playing
         self.preview_btn.setText("⏹️ Stop Preview")
         self.preview_btn.clicked.disconnect()
         self.preview_btn.clicked.connect(self.stop_preview)
     
+    def _preview_step(self):
+        """Play the next preview sample and schedule the one after it."""
+        import random  # Only needed while previewing, so kept off the startup path
+        state = self._preview_state
+        if state is None:
+            return
+        
+        samples = state['samples']
+        mode = state['mode']
+        if mode in (MODE_RANDOM, MODE_TRUE_RANDOM):
+            sample = random.choice(samples)
+        else:
+            sample = samples[state['index']]
+        state['index'] += 1
+        state['remaining'] -= 1
+        state['play'](sample)
+        
+        if state['remaining'] <= 0:
+            # Nothing left to play, so there is no need to wait after the last sample
+            self._preview_state = None
+            return
+        
+        if mode == MODE_TRUE_RANDOM:
+            delay = random.randint(1000, 3000)  # Random delay between 1-3 seconds
+        else:
+            delay = 2000  # Wait 2 seconds between samples
+        self._preview_timer.start(delay)
+    
     def stop_preview(self):
         """Stop the current round robin preview."""
-        if self.current_preview_thread and self.current_preview_thread.isRunning():
-            self.current_preview_thread.stop()
-            self.current_preview_thread.wait()  # Wait for thread to finish
-            self.current_preview_thread = None
+        self._preview_timer.stop()
+        self._preview_state = None
         
         # Reset button text
         self.preview_btn.setText("🎵 Preview")
@@ -3242,10 +3528,19 @@ class RoundRobinManager(QWidget):
     
     def get_note_name(self, midi_note):
         """Convert MIDI note number to note name."""
-        note_names = ['C', 'C#', 'D', 'D#', 'E', 'F', 'F#', 'G', 'G#', 'A', 'A#', 'B']
-        octave = (midi_note // 12) - 1
-        note_index = midi_note % 12
-        return f"{note_names[note_index]}{octave}"
+        return _note_name(midi_note)
+    
+    def mark_tree_dirty(self):
+        """Refresh the groups tree now if it is visible, otherwise on next show."""
+        self._tree_dirty = True
+        if self.groups_tree.isVisible():
+            self.update_groups_tree()
+    
+    def showEvent(self, event):
+        """Apply group changes made while the tree was hidden."""
+        super().showEvent(event)
+        if self._tree_dirty:
+            self.update_groups_tree()
     
     def closeEvent(self, event):
         """Clean up when the widget is closed."""
@@ -3254,28 +3549,29 @@ class RoundRobinManager(QWidget):
     
     def auto_detect_groups(self):
         """Auto-detect round robin groups from filename patterns."""
-        if not hasattr(self.sample_mapping, 'model'):
+        model = getattr(self.sample_mapping, 'model', None)
+        if model is None:
             QMessageBox.warning(self, "No Samples", "No samples available for auto-detection.")
             return
         
         # Group samples by base name (without round robin suffix)
-        samples_by_base = {}
-        for sample in self.sample_mapping.model.samples:
-            base_name = self.extract_base_name(sample.file_path.stem)
-            if base_name not in samples_by_base:
-                samples_by_base[base_name] = []
-            samples_by_base[base_name].append(sample)
+        samples_by_base = defaultdict(list)
+        extract_base_name = self.extract_base_name
+        for sample in model.samples:
+            samples_by_base[extract_base_name(sample.file_stem)].append(sample)
         
         # Create groups for samples with multiple variations
         detected_groups = 0
+        extract_position = self.extract_round_robin_position
         for base_name, samples in samples_by_base.items():
             if len(samples) > 1:
-                # Set seq_position for each sample based on filename pattern
-                for sample in samples:
-                    sample.seq_position = self.extract_round_robin_position(sample.file_path.stem)
-                
-                # Sort samples by detected position
-                samples.sort(key=lambda s: s.seq_position)
+                # Detect each sample's position from its filename pattern and sort
+                # by it (stable, comparing only the positions)
+                decorated = [(extract_position(sample.file_stem), sample) for sample in samples]
+                decorated.sort(key=itemgetter(0))
+                for i, (position, sample) in enumerate(decorated):
+                    sample.seq_position = position
+                    samples[i] = sample
                 
                 # Use the note name from the first sample instead of base name
                 first_sample = samples[0]
@@ -3283,31 +3579,35 @@ class RoundRobinManager(QWidget):
                 group_name = f"RR_{note_name}"
                 self.round_robin_groups[group_name] = {
                     'samples': samples,
-                    'seq_mode': 'round_robin',
+                    'seq_mode': MODE_ROUND_ROBIN,
                     'seq_length': len(samples)
                 }
                 detected_groups += 1
         
         if detected_groups > 0:
-            # Update existing groups or create new ones for detected groups
-            for group_name, group_data in self.round_robin_groups.items():
-                if hasattr(self.sample_mapping, 'model'):
+            # Index the model's groups by name once (first group wins, as before)
+            groups_by_name = {}
+            for group in model.sample_groups:
+                groups_by_name.setdefault(group.name, group)
+            add_sample_to_group = model.add_sample_to_group
+            
+            # Each sample move would broadcast a whole-model dataChanged; send one instead
+            with model.batch_update():
+                # Update existing groups or create new ones for detected groups
+                for group_name, group_data in self.round_robin_groups.items():
                     # Find existing group or create new one
-                    existing_group = None
-                    for group in self.sample_mapping.model.sample_groups:
-                        if group.name == group_name:
-                            existing_group = group
-                            break
+                    existing_group = groups_by_name.get(group_name)
                     
                     if existing_group:
                         # Update existing group
                         existing_group.seq_mode = group_data['seq_mode']
                         existing_group.seq_length = group_data['seq_length']
+                        group_data['model_group'] = existing_group
                         # Move samples to this group
                         for sample in group_data['samples']:
-                            self.sample_mapping.model.add_sample_to_group(sample, existing_group)
+                            add_sample_to_group(sample, existing_group)
                             # Reset individual sample round robin settings since group handles it
-                            sample.seq_mode = "always"
+                            sample.seq_mode = MODE_ALWAYS
                             sample.seq_length = 0
                     else:
                         # Create new group
@@ -3321,19 +3621,21 @@ class RoundRobinManager(QWidget):
                         )
                         
                         # Add the group to the model
-                        self.sample_mapping.model.add_sample_group(new_group)
+                        model.add_sample_group(new_group)
+                        group_data['model_group'] = new_group
                         
                         # Move samples to the new group
                         for sample in group_data['samples']:
-                            self.sample_mapping.model.add_sample_to_group(sample, new_group)
+                            add_sample_to_group(sample, new_group)
                             # Reset individual sample round robin settings since group handles it
-                            sample.seq_mode = "always"
+                            sample.seq_mode = MODE_ALWAYS
                             sample.seq_length = 0
             
-            self.update_groups_tree()
+            self.mark_tree_dirty()
             
             # Trigger XML update
             if hasattr(self, 'main_window') and self.main_window:
+                self.sample_mapping.mark_groups_changed()
                 self.main_window.schedule_xml_update()
             
             QMessageBox.information(self, "Auto-Detection Complete", 
@@ -3344,77 +3646,112 @@ class RoundRobinManager(QWidget):
     
     def extract_base_name(self, filename):
         """Extract base name from filename by removing round robin patterns."""
-        # Remove common round robin patterns
-        patterns = [
-            r'_rr\d+$',      # _rr1, _rr2, etc.
-            r'_\d+$',        # _1, _2, etc.
-            r'_round\d+$',   # _round1, _round2, etc.
-            r'_alt\d+$',     # _alt1, _alt2, etc.
-            r'_var\d+$',     # _var1, _var2, etc.
-            r'#\d+$',        # #1, #2, etc.
-        ]
+        # Every round robin suffix ends in a digit, so most plain names skip the regex
+        if not filename[-1:].isdecimal():
+            return filename
         
-        for pattern in patterns:
-            filename = re.sub(pattern, '', filename, flags=re.IGNORECASE)
-        
-        return filename
+        # Remove common round robin patterns
+        return _RR_BASE.sub('', filename, count=1)
     
     def extract_round_robin_position(self, filename):
         """Extract round robin position from filename patterns."""
-        # Check for # pattern first (e.g., C4#1, C4#2)
-        hash_match = re.search(r'#(\d+)$', filename)
-        if hash_match:
-            return int(hash_match.group(1))
-        
-        # Check for other patterns
-        patterns = [
-            (r'_rr(\d+)$', 1),      # _rr1, _rr2, etc.
-            (r'_(\d+)$', 1),        # _1, _2, etc.
-            (r'_round(\d+)$', 1),   # _round1, _round2, etc.
-            (r'_alt(\d+)$', 1),     # _alt1, _alt2, etc.
-            (r'_var(\d+)$', 1),     # _var1, _var2, etc.
-        ]
-        
-        for pattern, group_num in patterns:
-            match = re.search(pattern, filename, flags=re.IGNORECASE)
-            if match:
-                return int(match.group(group_num))
+        match = _RR_POSITION.search(filename) if filename[-1:].isdecimal() else None
+        if match:
+            return int(match.group(1))
         
         return 1  # Default position
     
     def update_groups_tree(self):
-        """Update the groups tree widget."""
-        self.groups_tree.clear()
-        
-        for group_name, group_data in self.round_robin_groups.items():
-            # Create details string
-            details = f"Mode: {group_data['seq_mode']}"
-            if group_data['seq_length'] > 0:
-                details += f", Length: {group_data['seq_length']}"
-            else:
-                details += ", Length: Auto"
-            
-            item = QTreeWidgetItem([
-                group_name,
-                group_data['seq_mode'],
-                str(len(group_data['samples'])),
-                str(group_data['seq_length']) if group_data['seq_length'] > 0 else "Auto",
-                details
-            ])
-            
-            # Add samples as child items
-            for i, sample in enumerate(group_data['samples']):
-                position = getattr(sample, 'seq_position', i+1)
-                child_item = QTreeWidgetItem([
-                    f"{i+1}. {sample.file_path.name}",
-                    f"Position {position}",
-                    "",
-                    "",
-                    f"File: {sample.file_path.name}"
-                ])
-                item.addChild(child_item)
-            
-            self.groups_tree.addTopLevelItem(item)
+        """Update the groups tree widget in place.
+
+        Existing group items are kept and only their texts refreshed; sample
+        child items are rebuilt only when the group's samples or positions changed.
+        """
+        self._tree_dirty = False
+        tree_items = self._tree_items
+        
+        self.groups_tree.setUpdatesEnabled(False)
+        try:
+            with QSignalBlocker(self.groups_tree):
+                # Take out items whose groups no longer exist
+                removed = [name for name in tree_items if name not in self.round_robin_groups]
+                if len(removed) > 1:
+                    # One removal for the whole tree instead of one per stale item;
+                    # the kept items are re-inserted in order below
+                    self.groups_tree.invisibleRootItem().takeChildren()
+                    for group_name in removed:
+                        del tree_items[group_name]
+                elif removed:
+                    item, _ = tree_items.pop(removed[0])
+                    self.groups_tree.takeTopLevelItem(self.groups_tree.indexOfTopLevelItem(item))
+                
+                items = []
+                new_items = []
+                new_at_end = True  # No existing item follows a new one
+                make_item = QTreeWidgetItem
+                for group_name, group_data in self.round_robin_groups.items():
+                    samples = group_data['samples']
+                    
+                    # Create details string
+                    details = f"Mode: {group_data['seq_mode']}"
+                    if group_data['seq_length'] > 0:
+                        details += f", Length: {group_data['seq_length']}"
+                    else:
+                        details += ", Length: Auto"
+                    texts = (
+                        group_name,
+                        group_data['seq_mode'],
+                        str(len(samples)),
+                        str(group_data['seq_length']) if group_data['seq_length'] > 0 else "Auto",
+                        details
+                    )
+                    
+                    positions = [getattr(sample, 'seq_position', i+1) for i, sample in enumerate(samples)]
+                    children_key = (list(map(id, samples)), positions)
+                    
+                    entry = tree_items.get(group_name)
+                    if entry is None:
+                        item = make_item(list(texts))
+                        new_items.append(item)
+                    else:
+                        item, old_children_key = entry
+                        for column, text in enumerate(texts):
+                            if item.text(column) != text:
+                                item.setText(column, text)
+                        if old_children_key == children_key:
+                            items.append(item)
+                            new_at_end = new_at_end and not new_items
+                            continue
+                        item.takeChildren()
+                        new_at_end = new_at_end and not new_items
+                    
+                    # Add samples as child items
+                    file_names = [sample.file_name for sample in samples]
+                    item.addChildren([
+                        make_item([
+                            f"{i+1}. {file_name}",
+                            f"Position {position}",
+                            "",
+                            "",
+                            f"File: {file_name}"
+                        ])
+                        for i, (file_name, position) in enumerate(zip(file_names, positions))
+                    ])
+                    tree_items[group_name] = (item, children_key)
+                    items.append(item)
+                
+                # Append new items if the tree already holds the rest in group order,
+                # otherwise (e.g. a renamed group moved to the end) re-insert everything
+                kept = len(items) - len(new_items)
+                index_of = self.groups_tree.indexOfTopLevelItem
+                if (new_at_end and self.groups_tree.topLevelItemCount() == kept
+                        and all(index_of(item) == row for row, item in enumerate(items[:kept]))):
+                    self.groups_tree.addTopLevelItems(new_items)
+                else:
+                    self.groups_tree.invisibleRootItem().takeChildren()
+                    self.groups_tree.addTopLevelItems(items)
+        finally:
+            self.groups_tree.setUpdatesEnabled(True)
         
         # Expand all items
         self.groups_tree.expandAll()
@@ -3426,4 +3763,4 @@ class RoundRobinManager(QWidget):
     def set_round_robin_groups(self, groups: dict):
         """Set round robin groups from saved data."""
         self.round_robin_groups = groups
-        self.update_groups_tree()
+        self.mark_tree_dirty()
@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+"""
+Tests for DecentSampler preset XML generation
+"""
+
+import sys
+from pathlib import Path
+
+# Make the application modules in src/ importable
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from decent_sampler import SampleGroup
+
+
+def test_default_group_attributes():
+    """A default group keeps ampVelTrack (DecentSampler defaults it to 1) and omits groupTuning."""
+    group = SampleGroup(name="C4")
+
+    assert group.xml_attributes() == {
+        "enabled": "true",
+        "volume": "1.0",
+        "ampVelTrack": "0.0",
+    }
+    assert group.to_xml_element().attrib == group.xml_attributes()
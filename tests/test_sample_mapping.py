@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Tests for the sample mapping table model
+"""
+
+import os
+import sys
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# Make the application modules in src/ importable
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from PySide6.QtWidgets import QApplication, QMessageBox
+
+from decent_sampler import Sample, SampleGroup
+from sample_mapping import SampleGroupModel, SampleMappingWidget, RoundRobinManager
+
+app = QApplication.instance() or QApplication([])
+
+
+def test_update_sample_group_range_after_loading_groups():
+    """Keyboard clicks and drops set the note range of a loaded group."""
+    groups = [
+        SampleGroup(name="C4", samples=[Sample(Path("Piano_C4.wav"), root_note=60)]),
+        SampleGroup(name="E4", samples=[Sample(Path("Piano_E4.wav"), root_note=64)]),
+    ]
+    model = SampleGroupModel(groups)
+
+    model.update_sample_group_range(1, 62, 61, 63)
+
+    group = model.get_sample_group(1)
+    assert (group.root_note, group.low_note, group.high_note) == (62, 61, 63)
+    assert (groups[0].root_note, groups[0].low_note, groups[0].high_note) == (60, 0, 127)
+
+
+def test_remove_selected_sample_removes_rows_incrementally(monkeypatch):
+    """Selected samples leave the table and their groups without a model reset."""
+    # Loading samples reports the auto-mapping result in a modal message box
+    monkeypatch.setattr(QMessageBox, "information", staticmethod(lambda *args, **kwargs: QMessageBox.Ok))
+
+    names = ["C4_1.wav", "C4_2.wav", "D4_1.wav", "D4_2.wav", "E4_1.wav", "E4_2.wav"]
+    samples = [Sample(Path(name)) for name in names]
+    widget = SampleMappingWidget()
+    widget.set_sample_groups([
+        SampleGroup(name="C4", samples=samples[:2]),
+        SampleGroup(name="D4", samples=samples[2:4]),
+        SampleGroup(name="E4", samples=samples[4:]),
+    ])
+    model = widget.model
+
+    removed_ranges = []
+    resets = []
+    model.rowsRemoved.connect(lambda parent, first, last: removed_ranges.append((first, last)))
+    model.modelReset.connect(lambda: resets.append(True))
+
+    # Two runs of contiguous rows: 1-3 and 5
+    selected = [model.samples[row] for row in (1, 2, 3, 5)]
+    for sample in selected:
+        sample.selected = True
+    widget.remove_selected_sample()
+
+    remaining = [sample for sample in samples if sample not in selected]
+    assert model.samples == remaining
+    assert model.rowCount() == len(remaining)
+    assert [group.samples for group in model.sample_groups] == [[samples[0]], [], [samples[4]]]
+    assert sorted(removed_ranges) == [(1, 3), (5, 5)]
+    assert not resets
+
+
+def tree_snapshot(tree):
+    """Texts of every top-level item and its children, in tree order."""
+    columns = range(tree.columnCount())
+    snapshot = []
+    for row in range(tree.topLevelItemCount()):
+        item = tree.topLevelItem(row)
+        children = [tuple(item.child(i).text(c) for c in columns) for i in range(item.childCount())]
+        snapshot.append((tuple(item.text(c) for c in columns), children))
+    return snapshot
+
+
+def fresh_tree_snapshot(round_robin_groups):
+    """Snapshot of a groups tree built from scratch for round_robin_groups."""
+    manager = RoundRobinManager()
+    manager.round_robin_groups = dict(round_robin_groups)
+    manager.update_groups_tree()
+    return tree_snapshot(manager.groups_tree)
+
+
+def make_round_robin_group(names, seq_mode="round_robin"):
+    samples = [Sample(Path(name), seq_position=position) for position, name in enumerate(names, 1)]
+    return {'samples': samples, 'seq_mode': seq_mode, 'seq_length': len(samples)}
+
+
+def test_groups_tree_updates_in_place():
+    """Edited, reordered and added groups match a freshly built tree."""
+    manager = RoundRobinManager()
+    groups = manager.round_robin_groups
+    groups["RR_C4"] = make_round_robin_group(["C4_rr1.wav", "C4_rr2.wav"])
+    groups["RR_E4"] = make_round_robin_group(["E4_rr1.wav", "E4_rr2.wav", "E4_rr3.wav"])
+    manager.update_groups_tree()
+    c4_item = manager.groups_tree.topLevelItem(0)
+
+    groups["RR_E4"]['seq_mode'] = "random"
+    groups["RR_E4"]['samples'].reverse()
+    groups["RR_G4"] = make_round_robin_group(["G4_1.wav", "G4_2.wav"])
+    manager.update_groups_tree()
+
+    assert tree_snapshot(manager.groups_tree) == fresh_tree_snapshot(groups)
+    # The unchanged group keeps its item
+    assert manager.groups_tree.topLevelItem(0) is c4_item
+
+
+def test_groups_tree_drops_removed_groups():
+    """Removing one or several groups, or renaming one, matches a freshly built tree."""
+    manager = RoundRobinManager()
+    groups = manager.round_robin_groups
+    for note in ["C4", "D4", "E4", "F4", "G4"]:
+        groups[f"RR_{note}"] = make_round_robin_group([f"{note}_rr1.wav", f"{note}_rr2.wav"])
+    manager.update_groups_tree()
+
+    del groups["RR_D4"]
+    manager.update_groups_tree()
+    assert tree_snapshot(manager.groups_tree) == fresh_tree_snapshot(groups)
+
+    del groups["RR_C4"]
+    del groups["RR_F4"]
+    manager.update_groups_tree()
+    assert tree_snapshot(manager.groups_tree) == fresh_tree_snapshot(groups)
+
+    groups["RR_E4_renamed"] = groups.pop("RR_E4")
+    manager.update_groups_tree()
+    assert tree_snapshot(manager.groups_tree) == fresh_tree_snapshot(groups)
+
+
+def test_get_model_group_ignores_groups_no_longer_in_the_model(monkeypatch):
+    """A cached group that left the model is replaced by the model's group of that name."""
+    # Loading samples reports the auto-mapping result in a modal message box
+    monkeypatch.setattr(QMessageBox, "information", staticmethod(lambda *args, **kwargs: QMessageBox.Ok))
+
+    samples = [Sample(Path("C4_rr1.wav")), Sample(Path("C4_rr2.wav"))]
+    widget = SampleMappingWidget()
+    widget.set_sample_groups([SampleGroup(name="RR_C4", samples=list(samples))])
+    manager = RoundRobinManager()
+    manager.sample_mapping = widget
+    model_group = widget.model.sample_groups[0]
+
+    group_data = {'samples': samples, 'seq_mode': "round_robin", 'seq_length': 2,
+                  'model_group': SampleGroup(name="RR_C4")}
+    assert manager.get_model_group("RR_C4", group_data) is model_group
+    assert group_data['model_group'] is model_group
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Tests for the live XML preview: skipped rebuilds and header-only patches
+must show the same XML as a preset built from scratch
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# Make the application modules in src/ importable
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QApplication, QMessageBox
+
+from decent_sampler import Sample, SampleGroup
+
+app = QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def window(tmp_path, monkeypatch):
+    """Main window with a few sample groups loaded and the preview visible."""
+    # Settings and caches are written below the home directory
+    monkeypatch.setenv("HOME", str(tmp_path))
+    # Loading samples reports the auto-mapping result in a modal message box
+    monkeypatch.setattr(QMessageBox, "information", staticmethod(lambda *args, **kwargs: QMessageBox.Ok))
+    import decent_sampler_gui
+
+    window = decent_sampler_gui.DecentSamplerMainWindow()
+    window.show()
+    groups = [
+        SampleGroup(name="C4", samples=[Sample(Path("Piano_C4_rr1.wav")), Sample(Path("Piano_C4_rr2.wav"))]),
+        SampleGroup(name="E4", volume="3dB", samples=[Sample(Path("Piano_E4.wav"))]),
+    ]
+    window.sample_mapping.set_sample_groups(groups)
+    window.update_xml_live()
+
+    # Count full rebuilds
+    window.rebuilds = 0
+    create_preset = window.create_preset
+    def counting_create_preset():
+        window.rebuilds += 1
+        return create_preset()
+    window.create_preset = counting_create_preset
+
+    yield window
+    window.close()
+
+
+def build_fresh(window) -> str:
+    """Build the preview text for the current UI state without any caching."""
+    preset = type(window).create_preset(window)
+    xml_tree = preset.to_xml(**dict(window.get_xml_groups_inputs()), **dict(window.get_xml_header_inputs()))
+    return window.format_xml(xml_tree)
+
+
+def assert_preview_current(window):
+    window.update_xml_live()
+    assert window.xml_editor.toPlainText() == build_fresh(window)
+
+
+def test_header_edits_patch_the_preview(window):
+    """Metadata edits reuse the serialized groups and match a full rebuild."""
+    edits = [
+        (window.preset_name_edit, "Grand <Piano> & Co"),
+        (window.author_edit, "Someone"),
+        (window.category_edit, "Keys"),
+        (window.min_version_edit, "1.2"),
+        (window.preset_name_edit, ""),
+        (window.min_version_edit, "0"),
+    ]
+    for edit, text in edits:
+        edit.setText(text)
+        assert_preview_current(window)
+    window.description_edit.setPlainText("Two\nlines")
+    assert_preview_current(window)
+
+    assert window.rebuilds == 0
+
+
+def test_global_attribute_edits_patch_the_preview(window):
+    """Global <groups> attribute edits only replace the opening <groups> line."""
+    window.volume_edit.setText('0.5"&')
+    assert_preview_current(window)
+    window.glide_mode_combo.setCurrentText("off")
+    assert_preview_current(window)
+    window.global_round_robin_checkbox.setChecked(True)
+    window.global_seq_mode_combo.setCurrentText("random")
+    window.global_seq_length_edit.setText("3")
+    assert_preview_current(window)
+    window.global_round_robin_checkbox.setChecked(False)
+    assert_preview_current(window)
+
+    assert window.rebuilds == 0
+
+
+def test_unchanged_inputs_skip_the_rebuild(window):
+    """Selection changes and repeated updates keep the cached preview."""
+    model = window.sample_mapping.model
+    model.setData(model.index(0, 0), True, Qt.EditRole)
+    assert_preview_current(window)
+    assert_preview_current(window)
+
+    assert window.rebuilds == 0
+
+
+def test_sample_edits_rebuild_the_preview(window):
+    """Sample mapping and samples path changes regenerate the whole preview."""
+    model = window.sample_mapping.model
+    model.setData(model.index(0, 4), 40, Qt.EditRole)
+    assert_preview_current(window)
+    assert window.rebuilds == 1
+
+    window.samples_path_edit.setText("Audio")
+    assert_preview_current(window)
+    assert window.rebuilds == 2
+
+    # Samples removed from their groups
+    model.remove_samples_from_groups(model.samples[:2])
+    assert_preview_current(window)
+    assert window.rebuilds == 3
+
+    # Group attributes edited directly, followed by an explicit refresh
+    model.sample_groups[-1].volume = "0.25"
+    window.round_robin_manager.refresh_xml()
+    assert_preview_current(window)
+    assert window.rebuilds == 4
+
+    # A header edit after a rebuild is patched onto the new groups
+    window.author_edit.setText("After")
+    assert_preview_current(window)
+    assert window.rebuilds == 4
+
+
+def test_sync_button_restores_edited_preview(window):
+    """The sync button regenerates the preview even when no input changed."""
+    window.xml_editor.setPlainText("<DecentSampler/>")
+    window.sync_xml_btn.click()
+
+    assert window.xml_editor.toPlainText() == build_fresh(window)
+    assert window.rebuilds == 1